@@ -21,27 +21,22 @@ from .nodes import (
 
 __version__ = "1.1.0"
 
-# Node mappings for ComfyUI registration
-NODE_CLASS_MAPPINGS: dict[str, type] = {
-    "AutoPromptLoader": AutoPromptLoader,
-    "AutoPromptBatch": AutoPromptBatch,
-    "AutoPromptCombiner": AutoPromptCombiner,
-    "AutoPromptRedNote": AutoPromptRedNote,
-    "SuffixEditor": SuffixEditor,
-    "PassportPrompt": PassportPrompt,
-    "PassportResize": PassportResize,
-    "PassportTile": PassportTile,
-}
+# Node registry: (node name, class, display name)
+_NODES: tuple[tuple[str, type, str], ...] = (
+    ("AutoPromptLoader", AutoPromptLoader, "🎨 Auto Prompt Loader"),
+    ("AutoPromptBatch", AutoPromptBatch, "🎨 Auto Prompt Batch"),
+    ("AutoPromptCombiner", AutoPromptCombiner, "🎨 Auto Prompt Combiner"),
+    ("AutoPromptRedNote", AutoPromptRedNote, "🎨 Auto Prompt RedNote"),
+    ("SuffixEditor", SuffixEditor, "✨ Suffix Editor"),
+    ("PassportPrompt", PassportPrompt, "📷 Passport Prompt"),
+    ("PassportResize", PassportResize, "📷 Passport Resize"),
+    ("PassportTile", PassportTile, "📷 Passport Tile (4x6)"),
+)
 
+# Node mappings for ComfyUI registration
+NODE_CLASS_MAPPINGS: dict[str, type] = {name: cls for name, cls, _ in _NODES}
 NODE_DISPLAY_NAME_MAPPINGS: dict[str, str] = {
-    "AutoPromptLoader": "🎨 Auto Prompt Loader",
-    "AutoPromptBatch": "🎨 Auto Prompt Batch",
-    "AutoPromptCombiner": "🎨 Auto Prompt Combiner",
-    "AutoPromptRedNote": "🎨 Auto Prompt RedNote",
-    "SuffixEditor": "✨ Suffix Editor",
-    "PassportPrompt": "📷 Passport Prompt",
-    "PassportResize": "📷 Passport Resize",
-    "PassportTile": "📷 Passport Tile (4x6)",
+    name: display for name, _, display in _NODES
 }
 
 __all__ = [
@@ -1,17 +1,26 @@
 """Core utilities for the Anime Prompt Loader ComfyUI nodes."""
 
-from .constants import DEFAULT_SUFFIX, PRESETS, PROMPT_DIR
+from .constants import DEFAULT_SUFFIX, PRESET_NAMES, PRESETS, PROMPT_DIR
 from .file_utils import (
     apply_suffix,
     get_available_txt_files,
+    load_clean_tags,
+    load_prompt_entries,
+    load_prompt_entries_with_tags,
     parse_prompt_file,
+    parse_prompt_file_cached,
 )
 
 __all__ = [
     "DEFAULT_SUFFIX",
+    "PRESET_NAMES",
     "PRESETS",
     "PROMPT_DIR",
     "apply_suffix",
     "get_available_txt_files",
+    "load_clean_tags",
+    "load_prompt_entries",
+    "load_prompt_entries_with_tags",
     "parse_prompt_file",
+    "parse_prompt_file_cached",
 ]
@@ -1,6 +1,7 @@
 """Constants and presets for Illustrious-XL anime prompt generation."""
 
 import os
+import sys
 from typing import Final
 
 # Directory containing prompt files
@@ -9,13 +10,14 @@ PROMPT_DIR: Final[str] = os.path.join(
 )
 
 # --- 1. CORE QUALITY TAGS ---
-QUALITY_TAGS: Final[str] = (
+# Interned like the presets built from it; equal copies share one object
+QUALITY_TAGS: Final[str] = sys.intern(
     "masterpiece, best quality, very aesthetic, absurdres, newest, sensitive, "
     "highres, complex background, best anatomy, 8k"
 )
 
 # --- 2. NEGATIVE PROMPTS ---
-STANDARD_NEGATIVE: Final[str] = (
+STANDARD_NEGATIVE: Final[str] = sys.intern(
     "worst quality, low quality, normal quality, lowres, anatomical nonsense, "
     "artistic error, bad anatomy, bad hands, missing fingers, extra fingers, extra digit, fewer digits, "
     "cropped, jpeg artifacts, signature, watermark, username, blurry, artist name, "
@@ -27,31 +29,73 @@ DEFAULT_SUFFIX: Final[str] = QUALITY_TAGS
 DEFAULT_NEGATIVE: Final[str] = STANDARD_NEGATIVE
 
 # --- 3. STYLE PRESETS (Refined for Girly/Emotional) ---
+# Each preset is stored as its fragments and joined once at import time.
+_Q = QUALITY_TAGS
+
+_RAW_PRESETS: Final[dict[str, tuple[str, ...]]] = {
+    "none": (),
+    "standard": (_Q,),
+    "dynamic": (_Q, "dynamic angle, wind, motion blur, dramatic pose, foreshortening"),
+    "atmospheric": (
+        _Q,
+        "cinematic lighting, Tyndall effect, dramatic shadows, 8k, masterpiece, ultra-detailed textures",
+    ),
+    "flat": (
+        _Q,
+        "(vibrant colors:1.2), flat color, vector, bold lines, simple background, colorful, white background",
+    ),
+    "dreamy": (
+        _Q,
+        "dreaming aesthetic, ethereal glow, sparkling stars, floating petals, soft pastel lighting",
+    ),
+    "gothic": (
+        _Q,
+        "dark theme, gothic, high contrast, chiaroscuro, mysterious, shadows",
+    ),
+    "retro": (
+        _Q,
+        "90s retro anime style, lo-fi aesthetic, grainy texture, muted colors, nostalgic gloom",
+    ),
+}
+
 PRESETS: Final[dict[str, str]] = {
-    "none": "",
-    "standard": QUALITY_TAGS,
-    "dynamic": f"{QUALITY_TAGS}, dynamic angle, wind, motion blur, dramatic pose, foreshortening",
-    "atmospheric": f"{QUALITY_TAGS}, cinematic lighting, Tyndall effect, dramatic shadows, 8k, masterpiece, ultra-detailed textures",
-    "flat": f"{QUALITY_TAGS}, (vibrant colors:1.2), flat color, vector, bold lines, simple background, colorful, white background",
-    "dreamy": f"{QUALITY_TAGS}, dreaming aesthetic, ethereal glow, sparkling stars, floating petals, soft pastel lighting",
-    "gothic": f"{QUALITY_TAGS}, dark theme, gothic, high contrast, chiaroscuro, mysterious, shadows",
-    "retro": f"{QUALITY_TAGS}, 90s retro anime style, lo-fi aesthetic, grainy texture, muted colors, nostalgic gloom",
+    k: sys.intern(", ".join(filter(None, parts))) for k, parts in _RAW_PRESETS.items()
 }
 
+# Preset names for node combo inputs (ComfyUI requires a list, not a tuple).
+# Shared by every node's INPUT_TYPES, so treat it as read-only.
+PRESET_NAMES: Final[list[str]] = list(PRESETS)
+
 # --- 4. MATCHING NEGATIVES ---
+_N = STANDARD_NEGATIVE
+
+_RAW_NEGATIVE_PRESETS: Final[dict[str, tuple[str, ...]]] = {
+    "none": (),
+    "standard": (_N, "simple background"),
+    "dynamic": (_N, "static, standing still, boring, simple background"),
+    "atmospheric": (_N, "flat color, harsh lighting, simple background"),
+    "flat": (
+        _N,
+        "3d, realistic lighting, gradient, photorealistic, shadow, complex background",
+    ),
+    "dreamy": (_N, "harsh lighting, horror, technology, modern"),
+    "gothic": (_N, "bright, pastel, cheerful, sunshine, simple background"),
+    "retro": (_N, "3d, realistic, modern, 4k, crisp, sharp focus"),
+}
+
 NEGATIVE_PRESETS: Final[dict[str, str]] = {
-    "none": "",
-    "standard": f"{STANDARD_NEGATIVE}, simple background",
-    "dynamic": f"{STANDARD_NEGATIVE}, static, standing still, boring, simple background",
-    "atmospheric": f"{STANDARD_NEGATIVE}, flat color, harsh lighting, simple background",
-    "flat": f"{STANDARD_NEGATIVE}, 3d, realistic lighting, gradient, photorealistic, shadow, complex background",
-    "dreamy": f"{STANDARD_NEGATIVE}, harsh lighting, horror, technology, modern",
-    "gothic": f"{STANDARD_NEGATIVE}, bright, pastel, cheerful, sunshine, simple background",
-    "retro": f"{STANDARD_NEGATIVE}, 3d, realistic, modern, 4k, crisp, sharp focus",
+    k: sys.intern(", ".join(filter(None, parts)))
+    for k, parts in _RAW_NEGATIVE_PRESETS.items()
 }
 
+
+def _intern_all(*items: str) -> tuple[str, ...]:
+    """Intern each string so repeated use across prompts shares one object."""
+    return tuple(sys.intern(item) for item in items)
+
+
 # --- 5. DYNAMIC ACTIONS ---
-ACTIONS: Final[list[str]] = [
+ACTIONS: Final[tuple[str, ...]] = _intern_all(
     # --- 🍞 Cute Eating ---
     "eating strawberry crepe, two hands holding crepe, puffy cheeks, cream on nose",
     "drinking bubble tea, one hand holding cup, straw in mouth, looking at viewer, cute",
@@ -119,10 +163,10 @@ ACTIONS: Final[list[str]] = [
     "sitting at table, small cake, single candle, party hat, dark room, shadows, celebrating alone, (tears:1.2), The Solo Birthday",
     "standing in rain, holding two umbrellas, looking at watch, waiting, wet clothes, disappointed, (lonely:1.3), The Rain Wait",
     "looking at smartphone, dark room, glowing screen, (crying:1.4), tears on screen, message read, The Phone Ghost",
-]
+)
 
 # --- 6. MATCHING BACKGROUNDS (No Magic, Real Places) ---
-BACKGROUNDS: Final[list[str]] = [
+BACKGROUNDS: Final[tuple[str, ...]] = _intern_all(
     # --- 🏫 School & Outdoor ---
     "school classroom, wooden desk, blackboard, windows, sunlight, afternoon",
     "school hallway, lockers, polished floor, sunlight rays, anime school",
@@ -140,17 +184,17 @@ BACKGROUNDS: Final[list[str]] = [
     "convenience store front, bright lights, night, glass door, shelves",
     "rooftop at sunset, chain link fence, warm sky, city skyline, wind",
     "train station platform, waiting area, empty seats, evening light, nostalgic",
-]
+)
 
 # --- 7. CAMERA EFFECTS (Simple & Aesthetic) ---
-CAMERA_EFFECTS: Final[list[str]] = [
+CAMERA_EFFECTS: Final[tuple[str, ...]] = _intern_all(
     "from above, looking down, depth of field",
     "from below, looking up, dramatic angle",
     "close-up, portrait, bokeh, focus on face",
     "wide shot, full body, distant view",
     "side view, profile, wind, hair flowing",
     "pov, first person view, intimate, close",
-]
+)
 
 # --- 8. FLUX / NATURAL LANGUAGE TEMPLATES ---
 FLUX_PREFIX: Final[str] = "A high-quality anime illustration of"
@@ -1,10 +1,41 @@
 """File utilities for parsing prompt files."""
 
+import contextlib
+import functools
+import hashlib
 import os
+import pickle
+import sys
+import tempfile
 from typing import NamedTuple
 
 from .constants import PROMPT_DIR
 
+_NO_TXT_FILES = "No TXT files found"
+
+# Separator inserted between tags and a suffix that lacks a leading comma
+_SEPARATOR = sys.intern(", ")
+
+# Sidecar directory (inside PROMPT_DIR) for pickled parse results
+_CACHE_DIR_NAME = ".cache"
+
+# Pickled payload layout version; caches written with another version are ignored
+_CACHE_FORMAT = 1
+
+# Errors that just mean the cache is unusable (missing, truncated, corrupt or
+# in an unexpected shape), so the file is parsed instead
+_CACHE_LOAD_ERRORS = (
+    OSError,
+    EOFError,
+    pickle.UnpicklingError,
+    AttributeError,
+    ValueError,
+    TypeError,
+)
+
+# Most prompt files kept in the in-memory caches; the oldest is evicted first
+_MEMORY_CACHE_MAX_FILES = 16
+
 
 class PromptEntry(NamedTuple):
     """A single prompt entry with tags and optional character name."""
@@ -13,18 +44,44 @@ class PromptEntry(NamedTuple):
     character_name: str
 
 
+# In-memory parse results shared by all nodes:
+# file_path -> (mtime_ns, size, entries)
+_PARSE_CACHE: dict[str, tuple[int, int, tuple[PromptEntry, ...]]] = {}
+
+# Cleaned tag columns derived from _PARSE_CACHE entries:
+# file_path -> (entries they were built from, clean tags)
+_CLEAN_TAGS_CACHE: dict[str, tuple[tuple[PromptEntry, ...], tuple[str, ...]]] = {}
+
+
+def _evict_oldest(cache: dict, key: str) -> None:
+    """Make room for key in a FIFO-capped in-memory cache."""
+    if key not in cache and len(cache) >= _MEMORY_CACHE_MAX_FILES:
+        del cache[next(iter(cache))]
+
+
 def get_available_txt_files() -> list[str]:
     """
     Get list of available TXT files in the prompt directory.
 
+    The directory listing is cached and only re-scanned when the
+    directory's modification time changes.
+
     Returns:
         List of TXT filenames. Returns ["No TXT files found"] if none exist.
     """
     try:
-        txt_files = [f for f in os.listdir(PROMPT_DIR) if f.endswith(".txt")]
-        return txt_files if txt_files else ["No TXT files found"]
+        mtime_ns = os.stat(PROMPT_DIR).st_mtime_ns
+        txt_files = _scan_txt_files(PROMPT_DIR, mtime_ns)
     except OSError:
-        return ["No TXT files found"]
+        return [_NO_TXT_FILES]
+    return list(txt_files) if txt_files else [_NO_TXT_FILES]
+
+
+@functools.lru_cache(maxsize=4)
+def _scan_txt_files(directory: str, mtime_ns: int) -> tuple[str, ...]:
+    """Scan a directory for TXT files (cached per directory mtime)."""
+    with os.scandir(directory) as entries:
+        return tuple(e.name for e in entries if e.name.endswith(".txt"))
 
 
 def parse_prompt_file(file_path: str) -> list[PromptEntry]:
@@ -44,27 +101,164 @@ def parse_prompt_file(file_path: str) -> list[PromptEntry]:
         FileNotFoundError: If the file doesn't exist.
         IOError: If the file can't be read.
     """
-    prompts: list[PromptEntry] = []
+    with open(file_path, "rb") as f:
+        data = f.read().decode("utf-8")
+
+    # partition() returns (tags, sep, name); name is "" when there is no tab
+    return [
+        PromptEntry(tags.strip(), char_name.strip())
+        for line in data.splitlines()
+        if (stripped := line.strip())
+        for tags, _, char_name in (stripped.partition("\t"),)
+    ]
+
+
+def parse_prompt_file_cached(file_path: str) -> list[PromptEntry]:
+    """
+    Parse a TXT prompt file, reusing an on-disk cache when possible.
+
+    Parsed entries are pickled to PROMPT_DIR/.cache/ together with the
+    source file's mtime and size (and a format version), and reloaded while
+    all of them still match. A missing, corrupt or outdated cache falls
+    back to a normal parse.
+
+    Args:
+        file_path: Absolute path to the TXT file.
+
+    Returns:
+        List of PromptEntry tuples containing (tags, character_name).
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        IOError: If the file can't be read.
+    """
+    st = os.stat(file_path)
+    digest = hashlib.sha1(os.path.abspath(file_path).encode("utf-8")).hexdigest()
+    cache_path = os.path.join(PROMPT_DIR, _CACHE_DIR_NAME, f"{digest}.pkl")
 
-    with open(file_path, encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
+    try:
+        with open(cache_path, "rb") as f:
+            fmt, mtime_ns, size, rows = pickle.load(f)
+        if fmt == _CACHE_FORMAT and mtime_ns == st.st_mtime_ns and size == st.st_size:
+            return list(map(PromptEntry._make, rows))
+    except _CACHE_LOAD_ERRORS:
+        pass
 
-            if "\t" in line:
-                parts = line.split("\t", 1)
-                tags = parts[0].strip()
-                char_name = parts[1].strip() if len(parts) > 1 else ""
-            else:
-                tags = line
-                char_name = ""
+    prompts = parse_prompt_file(file_path)
 
-            prompts.append(PromptEntry(tags=tags, character_name=char_name))
+    # Store plain tuples so the cache doesn't depend on this module's import path.
+    # Write to a temp file and rename it into place, so a crash or a concurrent
+    # writer never leaves a truncated cache behind.
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(
+                    (
+                        _CACHE_FORMAT,
+                        st.st_mtime_ns,
+                        st.st_size,
+                        [tuple(p) for p in prompts],
+                    ),
+                    f,
+                    protocol=5,
+                )
+            os.replace(tmp_path, cache_path)
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+    except OSError:
+        pass
 
     return prompts
 
 
+def load_prompt_entries(file_path: str) -> tuple[PromptEntry, ...]:
+    """
+    Load a TXT prompt file through a process-wide in-memory cache.
+
+    Entries are kept per path together with the file's mtime and size,
+    so repeated node executions on an unchanged file skip disk reads
+    and parsing entirely. At most _MEMORY_CACHE_MAX_FILES files are
+    kept; the oldest is dropped first. The result is a tuple because it is shared
+    between callers.
+
+    Args:
+        file_path: Absolute path to the TXT file.
+
+    Returns:
+        Tuple of PromptEntry tuples containing (tags, character_name).
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        IOError: If the file can't be read.
+    """
+    st = os.stat(file_path)
+    cached = _PARSE_CACHE.get(file_path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    entries = tuple(parse_prompt_file_cached(file_path))
+    _evict_oldest(_PARSE_CACHE, file_path)
+    _PARSE_CACHE[file_path] = (st.st_mtime_ns, st.st_size, entries)
+    return entries
+
+
+def load_prompt_entries_with_tags(
+    file_path: str,
+) -> tuple[tuple[PromptEntry, ...], tuple[str, ...]]:
+    """
+    Load a TXT prompt file's entries together with its cleaned tags column.
+
+    Both come from the same parsed version of the file (one stat, one
+    cache entry), so the two tuples are always parallel even if the file
+    is rewritten while a node is running.
+
+    Args:
+        file_path: Absolute path to the TXT file.
+
+    Returns:
+        Tuple of (entries, clean_tags); see load_clean_tags().
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        IOError: If the file can't be read.
+    """
+    entries = load_prompt_entries(file_path)
+    cached = _CLEAN_TAGS_CACHE.get(file_path)
+    if cached is not None and cached[0] is entries:
+        return cached
+
+    clean_tags = tuple(e.tags.strip().rstrip(",") for e in entries)
+    _evict_oldest(_CLEAN_TAGS_CACHE, file_path)
+    _CLEAN_TAGS_CACHE[file_path] = (entries, clean_tags)
+    return entries, clean_tags
+
+
+def load_clean_tags(file_path: str) -> tuple[str, ...]:
+    """
+    Load the cleaned tags column of a TXT prompt file.
+
+    Each entry's tags are stripped of surrounding whitespace and trailing
+    commas, ready to be joined into a prompt. The column is built once per
+    parsed version of the file, so nodes can index it directly instead of
+    re-cleaning entries inside their loops.
+
+    Args:
+        file_path: Absolute path to the TXT file.
+
+    Returns:
+        Tuple of cleaned tag strings, parallel to load_prompt_entries().
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        IOError: If the file can't be read.
+    """
+    return load_prompt_entries_with_tags(file_path)[1]
+
+
 def apply_suffix(tags: str, suffix: str, force_comma: bool = True) -> str:
     """
     Apply an aesthetic suffix to tags.
@@ -78,17 +272,18 @@ def apply_suffix(tags: str, suffix: str, force_comma: bool = True) -> str:
         Combined prompt string with suffix applied.
     """
     clean_tags = tags.strip().rstrip(",")
+    suffix = suffix.strip()
 
     if not suffix:
         return clean_tags
 
-    suffix = suffix.strip()
     if force_comma and not suffix.startswith(","):
-        suffix = ", " + suffix
+        return "".join((clean_tags, _SEPARATOR, suffix))
 
     return clean_tags + suffix
 
 
+@functools.lru_cache(maxsize=256)
 def get_prompt_file_path(filename: str) -> str:
     """
     Get the full path to a prompt file.
@@ -99,4 +294,5 @@ def get_prompt_file_path(filename: str) -> str:
     Returns:
         Absolute path to the file.
     """
+    # os.path.join keeps absolute names as-is; the lru_cache makes it cheap
     return os.path.join(PROMPT_DIR, filename)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import random
+import re
 from typing import Sequence, TypeVar
 
 from .constants import ACTIONS, BACKGROUNDS, CAMERA_EFFECTS
@@ -12,6 +13,9 @@ T = TypeVar("T")
 # Keywords that trigger safety shorts (exposed leg positions)
 SAFETY_TRIGGER_KEYWORDS: tuple[str, ...] = ("sitting", "hugging", "lying")
 
+# All trigger keywords as one alternation, so an action is scanned once
+_SAFETY_PATTERN = re.compile("|".join(map(re.escape, SAFETY_TRIGGER_KEYWORDS)))
+
 
 def pick_random(items: Sequence[T], rng: random.Random | None = None) -> T:
     """
@@ -57,4 +61,23 @@ def needs_safety_shorts(action: str) -> bool:
     Returns:
         True if the action contains trigger keywords.
     """
-    return any(keyword in action for keyword in SAFETY_TRIGGER_KEYWORDS)
+    return _SAFETY_PATTERN.search(action) is not None
+
+
+# Safety flag for each entry in ACTIONS, precomputed since ACTIONS is static
+_SAFETY_MASK: tuple[bool, ...] = tuple(needs_safety_shorts(a) for a in ACTIONS)
+
+
+def needs_safety_shorts_idx(idx: int) -> bool:
+    """
+    Check if the action at ACTIONS[idx] requires safety shorts.
+
+    Equivalent to needs_safety_shorts(ACTIONS[idx]) without the keyword scan.
+
+    Args:
+        idx: Index into ACTIONS.
+
+    Returns:
+        True if the action contains trigger keywords.
+    """
+    return _SAFETY_MASK[idx]
@@ -2,6 +2,9 @@
 RedNote (XiaoHongShu) Aesthetic Utilities - ARCHITECT PURE COMBINER MATCH.
 """
 
+import bisect
+import functools
+import re
 from typing import Final
 
 # --- 1. CLEAN NEGATIVE PROMPT ---
@@ -25,6 +28,9 @@ REDNOTE_NEG_SAFETY: Final[str] = (
 # Combined for backward compatibility
 REDNOTE_NEGATIVE_SUFFIX: Final[str] = REDNOTE_NEG_BASE + ", " + REDNOTE_NEG_SAFETY
 
+# Negative suffix with its leading separator baked in
+REDNOTE_NEGATIVE_SUFFIX_WITH_SEP: Final[str] = ", " + REDNOTE_NEGATIVE_SUFFIX
+
 # --- 2. POSITIVE SUFFIX (Pure & Safe) ---
 # NO STYLE WORDS. Just Body + Clothes + Safety.
 # This allows the "Dynamic Engine" from the Node to control the art style 100%.
@@ -50,20 +56,69 @@ REDNOTE_SAFETY_SHORTS: Final[str] = "(pretty white lace safety shorts:1.3)"
 
 
 # --- 3. MOOD PROMPTS ---
+# Upper bounds (exclusive) of each mood band, and the prompt for each band
+_MOOD_THRESHOLDS: Final[tuple[float, ...]] = (0.2, 0.4, 0.6, 0.8)
+_MOOD_PROMPTS: Final[tuple[str, ...]] = (
+    "(slight smile:1.2), (gentle expression:1.1), (obedient:1.1), demure",
+    "(expressionless:1.3), (neutral face:1.2), (serious:1.2), (looking down:1.1)",
+    "(stoned face:1.3), (hollow gaze:1.1), (dissociation:1.1)",
+    "(annoyed expression:1.3), (glaring:1.2), (displeased:1.2)",
+    "(stubborn:1.5), (pouting:1.4), (grumpy:1.4), (angry:1.2), (looking away:1.1)",
+)
+
+
 def get_mood_prompt(level: float) -> str:
-    if level < 0.2:
-        return "(slight smile:1.2), (gentle expression:1.1), (obedient:1.1), demure"
-    elif level < 0.4:
-        return "(expressionless:1.3), (neutral face:1.2), (serious:1.2), (looking down:1.1)"
-    elif level < 0.6:
-        return "(stoned face:1.3), (hollow gaze:1.1), (dissociation:1.1)"
-    elif level < 0.8:
-        return "(annoyed expression:1.3), (glaring:1.2), (displeased:1.2)"
-    else:
-        return "(stubborn:1.5), (pouting:1.4), (grumpy:1.4), (angry:1.2), (looking away:1.1)"
-
-
-# --- 4. COMPATIBILITY STUBS ---
+    # bisect_right so a level equal to a threshold falls into the next band
+    return _MOOD_PROMPTS[bisect.bisect_right(_MOOD_THRESHOLDS, level)]
+
+
+# --- 4. FLUX TAG CLEANING ---
+# Patterns used by clean_tag, compiled once
+_RE_WEIGHT = re.compile(r":\d+(\.\d+)?")
+# '1girl' and 'lora triggers:' are stripped together in one pass
+_RE_BOORU = re.compile(r"\b1girl\b|lora triggers?:?", re.IGNORECASE)
+_RE_COMMA = re.compile(r",\s*")
+_RE_WS = re.compile(r"\s+")
+
+# Drop brackets and turn underscores into spaces in a single pass
+_BRACKET_TRANS = str.maketrans({"(": None, ")": None, "{": None, "}": None, "_": " "})
+
+
+@functools.lru_cache(maxsize=2048)
+def clean_tag(text: str) -> str:
+    """
+    Aggressive cleaner for Flux/Natural Language.
+    Removes: weights (:1.3), parens, '1girl', 'lora triggers', and fixes commas.
+
+    Memoized: the action/background/camera pools and character entries
+    repeat heavily across a batch.
+    """
+    if not text:
+        return ""
+
+    # 1. Remove weights (e.g., :1.3, :0.5, :1)
+    text = _RE_WEIGHT.sub("", text)
+
+    # 2. Remove parenthesis completely
+    # 3. Replace underscores with spaces
+    text = text.translate(_BRACKET_TRANS)
+
+    # 4. Remove Booru-isms that sound robotic in sentences
+    # Remove '1girl' (we already say 'A girl with...') and
+    # 'lora triggers:' junk text (Case insensitive)
+    text = _RE_BOORU.sub("", text)
+
+    # 5. Fix Comma Spacing (tag1,tag2 -> tag1, tag2)
+    text = _RE_COMMA.sub(", ", text)
+
+    # 6. Cleanup double spaces or trailing punctuation
+    text = _RE_WS.sub(" ", text).strip()
+    text = text.strip(", ")  # Remove trailing commas
+
+    return text
+
+
+# --- 5. COMPATIBILITY STUBS ---
 def get_random_palette() -> dict[str, str]:
     return {"bg": "", "clothes": ""}
 
@@ -73,7 +128,10 @@ def get_weighted_color_tag(tag: str) -> str:
 
 
 def apply_rednote_style(positive: str, negative: str) -> tuple[str, str]:
-    return positive + REDNOTE_POSITIVE_SUFFIX, negative + ", " + REDNOTE_NEGATIVE_SUFFIX
+    return (
+        "".join((positive, REDNOTE_POSITIVE_SUFFIX)),
+        "".join((negative, REDNOTE_NEGATIVE_SUFFIX_WITH_SEP)),
+    )
 
 
 def filter_characters(*args, **kwargs):
@@ -6,6 +6,15 @@ import pandas as pd
 INPUT_FILE = "pure_1girl_v1.csv"
 OUTPUT_FILE = "system_lock_prompts.txt"
 
+# Rows read per chunk (keeps memory flat for large CSVs)
+CHUNK_SIZE = 50_000
+
+# Bytes per block when parsing with pyarrow
+ARROW_BLOCK_SIZE = 8 << 20
+
+# Output buffer size; each chunk is written as one encoded blob
+WRITE_BUFFER_SIZE = 1 << 20
+
 # Your specialized aesthetic "System-Lock" suffix
 # Optimized for 7900XTX rendering and high-fidelity output
 AESTHETIC_SUFFIX = (
@@ -14,34 +23,69 @@ AESTHETIC_SUFFIX = (
     "sharp focus, cinematic lighting"
 )
 
+# Every output line ends with the suffix, so it doubles as the join separator
+LINE_END = AESTHETIC_SUFFIX + "\n"
+
+
+def _iter_tag_chunks():
+    """
+    Yield the first CSV column (the tags) as string Series, chunk by chunk.
+
+    Uses pyarrow's streaming CSV reader (single-threaded, block by block) when
+    it is installed, otherwise pandas' chunked C parser.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        for chunk in pd.read_csv(
+            INPUT_FILE,
+            header=None,
+            usecols=[0],
+            dtype=str,
+            # Empty and "NA" cells stay literal strings, as with pyarrow
+            keep_default_na=False,
+            chunksize=CHUNK_SIZE,
+        ):
+            yield chunk[0].astype(str)
+        return
+
+    reader = pacsv.open_csv(
+        INPUT_FILE,
+        read_options=pacsv.ReadOptions(
+            autogenerate_column_names=True, block_size=ARROW_BLOCK_SIZE
+        ),
+        convert_options=pacsv.ConvertOptions(
+            column_types={"f0": pa.string()}, include_columns=["f0"]
+        ),
+    )
+    for batch in reader:
+        yield batch.column(0).to_pandas()
+
 
 def generate_prompts():
     if not os.path.exists(INPUT_FILE):
         print(f"Error: {INPUT_FILE} not found in current directory.")
         return
 
-    # Load data - skipping header as the file appears to be raw tag strings
+    # Load data - skipping header as the file appears to be raw tag strings.
+    # Read in chunks and stream each one out so only one chunk is resident.
     try:
-        df = pd.read_csv(INPUT_FILE, header=None)
-
-        # The first column contains the tags
-        raw_tags = df[0].astype(str).tolist()
-
-        processed_prompts = []
-        for tags in raw_tags:
-            # Clean and append suffix
-            clean_tags = tags.strip().rstrip(",")
-            full_prompt = clean_tags + AESTHETIC_SUFFIX
-            processed_prompts.append(full_prompt)
-
-        # Write to text file (one prompt per line for batch loaders)
-        with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-            for p in processed_prompts:
-                f.write(p + "\n")
-
-        print(
-            f"Success: {len(processed_prompts)} prompts optimized and saved to {OUTPUT_FILE}."
-        )
+        total = 0
+        with open(OUTPUT_FILE, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            for tags in _iter_tag_chunks():
+                # The first column contains the tags; clean them using
+                # pandas' vectorized string methods
+                processed_prompts = tags.str.strip().str.rstrip(",")
+                if processed_prompts.empty:
+                    continue
+
+                # Append the suffix while joining, encode the chunk once and
+                # write it (one prompt per line for batch loaders)
+                f.write((LINE_END.join(processed_prompts) + LINE_END).encode("utf-8"))
+                total += len(processed_prompts)
+
+        print(f"Success: {total} prompts optimized and saved to {OUTPUT_FILE}.")
 
     except Exception as e:
         print(f"System Error during processing: {e}")
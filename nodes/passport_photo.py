@@ -7,12 +7,13 @@ Designed for use with Qwen-Image-Edit-2511 GGUF workflow.
 
 from __future__ import annotations
 
-from typing import Any
-
-from PIL import Image
-import numpy as np
-import torch
+from typing import TYPE_CHECKING, Any
 
+# torch and PIL are imported inside the functions that use them, so loading
+# this module (at ComfyUI startup) doesn't pay for them until a node runs.
+if TYPE_CHECKING:
+    import torch
+    from PIL import Image
 
 # USA Passport Photo Specifications
 PASSPORT_SIZES: dict[str, tuple[int, int]] = {
@@ -21,6 +22,12 @@ PASSPORT_SIZES: dict[str, tuple[int, int]] = {
     "digital_only": (800, 800),  # High-res square for digital use
 }
 
+# Size combo choices (ComfyUI requires a list, not a tuple)
+_PASSPORT_SIZE_KEYS: list[str] = list(PASSPORT_SIZES)
+
+# Box-filter pre-reduction factor for large downscales (same as PIL's thumbnail())
+REDUCING_GAP = 3.0
+
 DEFAULT_PASSPORT_PROMPT = (
     "Make a professional USA passport photo: pure white background, "
     "center the face and shoulders perfectly, neutral expression with "
@@ -29,6 +36,74 @@ DEFAULT_PASSPORT_PROMPT = (
 )
 
 
+def _pil_to_tensor(image: Image.Image) -> torch.Tensor:
+    """
+    Convert a PIL image to a ComfyUI IMAGE tensor.
+
+    Args:
+        image: PIL image (converted to RGB if needed)
+
+    Returns:
+        Tensor of shape (1, H, W, 3), float32 in [0, 1]
+    """
+    import torch
+
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+
+    # Single uint8 -> float32 pass; scaling is done in place on the new tensor
+    pixels = torch.frombuffer(bytearray(image.tobytes()), dtype=torch.uint8)
+    pixels = pixels.reshape(image.height, image.width, 3)
+    return pixels.to(torch.float32).mul_(1.0 / 255.0).unsqueeze_(0)
+
+
+def _tensor_to_pil(tensor: torch.Tensor) -> Image.Image:
+    """
+    Convert a ComfyUI IMAGE tensor to a PIL image.
+
+    Scaling, clamping and the uint8 cast run on the tensor's own device
+    before the transfer, so only uint8 bytes are copied to the CPU. The
+    caller's tensor is not modified.
+
+    Args:
+        tensor: Image tensor (B, H, W, C) or (H, W, C), float32 in [0, 1]
+
+    Returns:
+        RGB PIL image of the first image in the batch
+    """
+    import torch
+    from PIL import Image
+
+    if tensor.dim() == 4:
+        tensor = tensor[0]
+    pixels = tensor.mul(255).clamp_(0, 255).to(torch.uint8).contiguous().cpu()
+    return Image.fromarray(pixels.numpy(), mode="RGB")
+
+
+def _resize_on_device(pixels: torch.Tensor, size: tuple[int, int]) -> torch.Tensor:
+    """
+    Resize an (H, W, C) image tensor without leaving its device.
+
+    Used for GPU inputs, where the PIL path would force a blocking
+    device -> host copy. Antialiased bicubic is the closest torch
+    equivalent of PIL's Lanczos for downscaling.
+
+    Args:
+        pixels: Image tensor (H, W, C), float32 in [0, 1]
+        size: Target (width, height)
+
+    Returns:
+        Tensor of shape (1, height, width, C), float32 in [0, 1]
+    """
+    import torch.nn.functional as F
+
+    width, height = size
+    nchw = pixels.permute(2, 0, 1).unsqueeze(0)
+    resized = F.interpolate(nchw, size=(height, width), mode="bicubic", antialias=True)
+    # Bicubic overshoots at hard edges; keep the IMAGE range contract
+    return resized.clamp_(0.0, 1.0).permute(0, 2, 3, 1).contiguous()
+
+
 class PassportPrompt:
     """
     Generate optimized prompts for USA passport photo editing.
@@ -112,6 +187,8 @@ class PassportResize:
     Inputs:
         image: Any image to resize
         output_size: Target passport dimensions
+        crop_mode: How to crop non-square images
+        max_quality: Use full Lanczos resampling (slower on large inputs)
 
     Outputs:
         IMAGE: Square passport photo at target resolution
@@ -130,7 +207,7 @@ class PassportResize:
             "required": {
                 "image": ("IMAGE",),
                 "output_size": (
-                    list(PASSPORT_SIZES.keys()),
+                    _PASSPORT_SIZE_KEYS,
                     {"default": "2x2_inch_600dpi"},
                 ),
                 "crop_mode": (
@@ -138,6 +215,9 @@ class PassportResize:
                     {"default": "center"},
                 ),
             },
+            "optional": {
+                "max_quality": ("BOOLEAN", {"default": False}),
+            },
         }
 
     def resize_to_passport(
@@ -145,6 +225,7 @@ class PassportResize:
         image: torch.Tensor,
         output_size: str,
         crop_mode: str,
+        max_quality: bool = False,
     ) -> tuple[torch.Tensor, str]:
         """
         Resize image to passport dimensions.
@@ -153,38 +234,58 @@ class PassportResize:
             image: Input image tensor (B, H, W, C)
             output_size: Target size key
             crop_mode: How to crop non-square images
+            max_quality: Skip the box-filter pre-reduction before Lanczos
 
         Returns:
             Tuple of (resized_image, info_string)
         """
+        from PIL import Image
+
         target_size = PASSPORT_SIZES[output_size]
         target_w, target_h = target_size
 
-        # Convert tensor to PIL for processing
         # ComfyUI format: (B, H, W, C) float32 [0, 1]
-        img_np = image[0].cpu().numpy()
-        img_np = (img_np * 255).clip(0, 255).astype(np.uint8)
-        pil_img = Image.fromarray(img_np, mode="RGB")
-
-        orig_w, orig_h = pil_img.size
+        orig_h, orig_w = image.shape[1], image.shape[2]
 
-        # Crop to square if needed
+        # Square crop box (left, top, side), or None when no crop is needed
+        crop = None
         if crop_mode != "none" and orig_w != orig_h:
             min_dim = min(orig_w, orig_h)
-            if crop_mode == "center":
-                left = (orig_w - min_dim) // 2
-                top = (orig_h - min_dim) // 2
-            else:  # top - keep face at top
-                left = (orig_w - min_dim) // 2
-                top = 0
-            pil_img = pil_img.crop((left, top, left + min_dim, top + min_dim))
+            left = (orig_w - min_dim) // 2
+            # center, or top - keep face at top
+            top = (orig_h - min_dim) // 2 if crop_mode == "center" else 0
+            crop = (left, top, min_dim)
+
+        # Already the right size: no crop or resize needed, skip PIL entirely.
+        # Still clamp (which also copies) to keep the IMAGE range contract
+        if orig_w == target_w and orig_h == target_h:
+            result_tensor = image[:1].clamp(0.0, 1.0)
+        elif image.device.type != "cpu":
+            # Crop by slicing and resize with torch so the image stays on GPU
+            pixels = image[0]
+            if crop is not None:
+                left, top, side = crop
+                pixels = pixels[top : top + side, left : left + side]
+            result_tensor = _resize_on_device(pixels, target_size)
+        else:
+            # Convert tensor to PIL for processing
+            pil_img = _tensor_to_pil(image)
+
+            # Crop to square if needed
+            if crop is not None:
+                left, top, side = crop
+                pil_img = pil_img.crop((left, top, left + side, top + side))
 
-        # Resize to target
-        resized = pil_img.resize(target_size, Image.Resampling.LANCZOS)
+            # Resize to target; reducing_gap lets PIL box-filter large inputs
+            # down first so Lanczos only runs on the final ~3x reduction
+            resized = pil_img.resize(
+                target_size,
+                Image.Resampling.LANCZOS,
+                reducing_gap=None if max_quality else REDUCING_GAP,
+            )
 
-        # Convert back to tensor
-        result_np = np.array(resized).astype(np.float32) / 255.0
-        result_tensor = torch.from_numpy(result_np).unsqueeze(0)
+            # Convert back to tensor
+            result_tensor = _pil_to_tensor(resized)
 
         # Build info
         info = (
@@ -235,18 +336,34 @@ class PassportTile:
         Returns:
             1800x1200 tiled image (4x6 at 300 DPI)
         """
-        # Convert to PIL
-        img_np = image[0].cpu().numpy()
-        img_np = (img_np * 255).clip(0, 255).astype(np.uint8)
-        passport = Image.fromarray(img_np, mode="RGB")
+        import torch
+        from PIL import Image
+
+        if image.device.type != "cpu":
+            # GPU input: resize (if needed) and tile without leaving the device
+            tile = image[0]
+            if tile.shape[:2] != (600, 600):
+                tile = _resize_on_device(tile, (600, 600))[0]
+            # Clamp like the CPU path's PIL round trip, resized or not
+            tile = tile.clamp(0.0, 1.0)
+        else:
+            # Convert to PIL
+            passport = _tensor_to_pil(image)
+
+            # Resize to exactly 600x600 if needed
+            if passport.size != (600, 600):
+                passport = passport.resize(
+                    (600, 600), Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP
+                )
 
-        # Resize to exactly 600x600 if needed
-        if passport.size != (600, 600):
-            passport = passport.resize((600, 600), Image.Resampling.LANCZOS)
+            # Convert the single 600x600 photo to a tensor once
+            tile = _pil_to_tensor(passport)[0]
 
-        # Create 4x6 canvas (1800x1200 at 300 DPI)
+        # Create white 4x6 canvas (1800x1200 at 300 DPI)
         # Layout: 2 columns x 2 rows of 600x600, centered
-        canvas = Image.new("RGB", (1800, 1200), color=(255, 255, 255))
+        result_tensor = torch.ones(
+            (1, 1200, 1800, 3), dtype=torch.float32, device=tile.device
+        )
 
         # Calculate positions (centered with some margin)
         # 2 photos horizontally: 600*2 = 1200, margin = (1800-1200)/2 = 300
@@ -259,11 +376,8 @@ class PassportTile:
             (margin_x + 600, 600),  # Bottom right
         ]
 
-        for pos in positions:
-            canvas.paste(passport, pos)
-
-        # Convert back to tensor
-        result_np = np.array(canvas).astype(np.float32) / 255.0
-        result_tensor = torch.from_numpy(result_np).unsqueeze(0)
+        # Copy the photo into each slot with plain slice assignment
+        for x, y in positions:
+            result_tensor[0, y : y + 600, x : x + 600, :] = tile
 
         return (result_tensor,)
@@ -5,6 +5,7 @@ Outputs multiple prompts for batch image generation with dynamic actions, backgr
 Formula: Quality Tags + Character + Action + Background + Camera Effects
 """
 
+import itertools
 import random
 from typing import Any
 
@@ -15,15 +16,26 @@ from ..core.constants import (
     DEFAULT_NEGATIVE,
     DEFAULT_SUFFIX,
     NEGATIVE_PRESETS,
+    PRESET_NAMES,
     PRESETS,
 )
 from ..core.file_utils import (
     get_available_txt_files,
     get_prompt_file_path,
-    parse_prompt_file,
+    load_clean_tags,
 )
 
 
+def _clean_suffix(suffix: str) -> str:
+    """Strip a preset suffix's leading comma for use as the first prompt part."""
+    return suffix.lstrip(", ").strip() if suffix else ""
+
+
+# Preset suffixes with the leading comma removed, computed once
+_CLEAN_PRESETS: dict[str, str] = {k: _clean_suffix(v) for k, v in PRESETS.items()}
+_CLEAN_DEFAULT_SUFFIX = _clean_suffix(DEFAULT_SUFFIX)
+
+
 class AutoPromptBatch:
     """
     Output multiple prompts for batch image generation.
@@ -74,7 +86,7 @@ class AutoPromptBatch:
                     {"default": 4, "min": 1, "max": 1000, "step": 1},
                 ),
                 "preset": (
-                    list(PRESETS.keys()),
+                    PRESET_NAMES,
                     {"default": "standard"},
                 ),
                 "random_action": ("BOOLEAN", {"default": True}),
@@ -146,7 +158,7 @@ class AutoPromptBatch:
         file_path = get_prompt_file_path(prompt_file)
 
         try:
-            prompts = parse_prompt_file(file_path)
+            prompts = load_clean_tags(file_path)
         except FileNotFoundError:
             return ([f"Error: {prompt_file} not found"], "")
         except OSError as e:
@@ -156,66 +168,47 @@ class AutoPromptBatch:
             return (["Error: No prompts found"], "")
 
         total = len(prompts)
-        result: list[str] = []
 
-        # Initialize random with seed
-        random.seed(seed)
+        rng = random.Random(seed)
 
-        # Get preset values
-        preset_suffix = PRESETS.get(preset, DEFAULT_SUFFIX)
+        # Get preset values (suffixes are pre-cleaned at import)
+        clean_preset = _CLEAN_PRESETS.get(preset, _CLEAN_DEFAULT_SUFFIX)
         preset_negative = NEGATIVE_PRESETS.get(preset, DEFAULT_NEGATIVE)
 
-        # Clean preset suffix (remove leading comma)
-        clean_preset = preset_suffix.lstrip(", ").strip() if preset_suffix else ""
-
-        for i in range(batch_size):
-            idx = (start_index + i) % total
-            entry = prompts[idx]
-
-            # Build prompt using formula:
-            # Quality Tags + Character + Action + Background + Camera + Custom
-            parts: list[str] = []
-
-            # 1. Quality Tags
-            if clean_preset:
-                parts.append(clean_preset)
-
-            # 2. Character tags
-            character_tags = entry.tags.strip().rstrip(",")
-            if character_tags:
-                parts.append(character_tags)
-
-            # 3. Random Action (different for each batch item)
-            if random_action:
-                action = random.choice(ACTIONS)
-                parts.append(action)
-
-            # 4. Random Background (different for each batch item)
-            if random_background:
-                background = random.choice(BACKGROUNDS)
-                parts.append(background)
-
-            # 5. Random Camera (different for each batch item)
-            if random_camera:
-                camera = random.choice(CAMERA_EFFECTS)
-                parts.append(camera)
-
-            # 6. Custom Positive
-            if custom_positive.strip():
-                custom = custom_positive.strip().lstrip(",").strip()
-                if custom:
-                    parts.append(custom)
-
-            # Join all parts
-            final_prompt = ", ".join(filter(None, parts))
-            result.append(final_prompt)
+        # Draw every random pick for the batch up front (one call per category)
+        no_picks = [""] * batch_size
+        actions = rng.choices(ACTIONS, k=batch_size) if random_action else no_picks
+        backgrounds = (
+            rng.choices(BACKGROUNDS, k=batch_size) if random_background else no_picks
+        )
+        cameras = (
+            rng.choices(CAMERA_EFFECTS, k=batch_size) if random_camera else no_picks
+        )
+
+        # Loop invariants: custom tags, and the character tags of the
+        # (at most `total`) distinct entries this batch cycles through
+        custom_clean = custom_positive.strip().lstrip(",").strip()
+        window = min(batch_size, total)
+        character_window = [prompts[(start_index + j) % total] for j in range(window)]
+
+        # Quality Tags + Character + Action + Background + Camera + Custom;
+        # the character window repeats when batch_size exceeds the file length
+        result = [
+            ", ".join(
+                [p for p in (clean_preset, tags, action, bg, camera, custom_clean) if p]
+            )
+            for tags, action, bg, camera in zip(
+                itertools.cycle(character_window), actions, backgrounds, cameras
+            )
+        ]
 
         # Combine preset negative + custom_negative
-        if custom_negative.strip():
+        custom_neg = custom_negative.strip()
+        if custom_neg:
             if preset_negative:
-                final_negative = f"{preset_negative}, {custom_negative.strip()}"
+                final_negative = f"{preset_negative}, {custom_neg}"
             else:
-                final_negative = custom_negative.strip()
+                final_negative = custom_neg
         else:
             final_negative = preset_negative
 
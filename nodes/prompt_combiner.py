@@ -15,12 +15,13 @@ from ..core.constants import (
     DEFAULT_NEGATIVE,
     DEFAULT_SUFFIX,
     NEGATIVE_PRESETS,
+    PRESET_NAMES,
     PRESETS,
 )
 from ..core.file_utils import (
     get_available_txt_files,
     get_prompt_file_path,
-    parse_prompt_file,
+    load_clean_tags,
 )
 
 
@@ -103,7 +104,7 @@ class AutoPromptCombiner:
                     {"default": 1, "min": 1, "max": 100, "step": 1},
                 ),
                 "preset": (
-                    list(PRESETS.keys()),
+                    PRESET_NAMES,
                     {"default": "dynamic"},
                 ),
                 "random_action": ("BOOLEAN", {"default": True}),
@@ -163,17 +164,27 @@ class AutoPromptCombiner:
         Returns:
             Tuple of (list of prompts, negative prompt).
         """
+        # Limit total prompts (checked before any file I/O)
+        total_prompts = char_count * style_count
+        if total_prompts > self.MAX_TOTAL_PROMPTS:
+            return (
+                [
+                    f"Error: Total prompts ({total_prompts}) exceeds max ({self.MAX_TOTAL_PROMPTS})"
+                ],
+                "",
+            )
+
         # Load character file
         char_path = get_prompt_file_path(character_file)
         try:
-            characters = parse_prompt_file(char_path)
+            characters = load_clean_tags(char_path)
         except (FileNotFoundError, OSError) as e:
             return ([f"Error loading characters: {e}"], "")
 
         # Load style file
         style_path = get_prompt_file_path(style_file)
         try:
-            styles = parse_prompt_file(style_path)
+            styles = load_clean_tags(style_path)
         except (FileNotFoundError, OSError) as e:
             return ([f"Error loading styles: {e}"], "")
 
@@ -182,18 +193,7 @@ class AutoPromptCombiner:
         if not styles:
             return (["Error: No styles found"], "")
 
-        # Limit total prompts
-        total_prompts = char_count * style_count
-        if total_prompts > self.MAX_TOTAL_PROMPTS:
-            return (
-                [
-                    f"Error: Total prompts ({total_prompts}) exceeds max ({self.MAX_TOTAL_PROMPTS})"
-                ],
-                "",
-            )
-
-        # Initialize random
-        random.seed(seed)
+        rng = random.Random(seed)
 
         # Get preset values
         preset_suffix = PRESETS.get(preset, DEFAULT_SUFFIX)
@@ -202,15 +202,32 @@ class AutoPromptCombiner:
 
         result: list[str] = []
 
-        # Nested loop: for each character, iterate through styles
-        for char_offset in range(char_count):
-            char_idx = (char_start_index + char_offset) % len(characters)
-            char = characters[char_idx]
-
-            for style_offset in range(style_count):
-                style_idx = (style_start_index + style_offset) % len(styles)
-                style = styles[style_idx]
+        # Draw every random pick up front (one call per category); the nested
+        # loop consumes them in order via `n`
+        no_picks = [""] * total_prompts
+        actions = rng.choices(ACTIONS, k=total_prompts) if random_action else no_picks
+        backgrounds = (
+            rng.choices(BACKGROUNDS, k=total_prompts) if random_background else no_picks
+        )
+        cameras = (
+            rng.choices(CAMERA_EFFECTS, k=total_prompts) if random_camera else no_picks
+        )
+        n = 0
+
+        # Loop invariants: custom tags, and the character/style tags selected
+        # by the start indices (the style window is shared by every character)
+        custom_clean = custom_positive.strip().lstrip(",").strip()
+        num_chars, num_styles = len(characters), len(styles)
+        char_window = [
+            characters[(char_start_index + o) % num_chars] for o in range(char_count)
+        ]
+        style_window = [
+            styles[(style_start_index + o) % num_styles] for o in range(style_count)
+        ]
 
+        # Nested loop: for each character, iterate through styles
+        for char_tags in char_window:
+            for style_tags in style_window:
                 # Build prompt: Quality + Style + Character + Action + Bg + Camera
                 parts: list[str] = []
 
@@ -219,42 +236,33 @@ class AutoPromptCombiner:
                     parts.append(clean_preset)
 
                 # 2. Style tags (from style file)
-                style_tags = style.tags.strip().rstrip(",")
                 if style_tags:
                     parts.append(style_tags)
 
                 # 3. Character tags (from character file)
-                char_tags = char.tags.strip().rstrip(",")
                 if char_tags:
                     parts.append(char_tags)
 
-                # 4. Random Action
-                if random_action:
-                    parts.append(random.choice(ACTIONS))
-
-                # 5. Random Background
-                if random_background:
-                    parts.append(random.choice(BACKGROUNDS))
-
-                # 6. Random Camera
-                if random_camera:
-                    parts.append(random.choice(CAMERA_EFFECTS))
+                # 4-6. Random Action / Background / Camera
+                for pick in (actions[n], backgrounds[n], cameras[n]):
+                    if pick:
+                        parts.append(pick)
+                n += 1
 
                 # 7. Custom Positive
-                if custom_positive.strip():
-                    custom = custom_positive.strip().lstrip(",").strip()
-                    if custom:
-                        parts.append(custom)
+                if custom_clean:
+                    parts.append(custom_clean)
 
-                final_prompt = ", ".join(filter(None, parts))
+                final_prompt = ", ".join(parts)
                 result.append(final_prompt)
 
         # Combine negatives
-        if custom_negative.strip():
+        custom_neg = custom_negative.strip()
+        if custom_neg:
             if preset_negative:
-                final_negative = f"{preset_negative}, {custom_negative.strip()}"
+                final_negative = f"{preset_negative}, {custom_neg}"
             else:
-                final_negative = custom_negative.strip()
+                final_negative = custom_neg
         else:
             final_negative = preset_negative
 
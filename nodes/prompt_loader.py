@@ -15,13 +15,13 @@ from ..core.constants import (
     DEFAULT_NEGATIVE,
     DEFAULT_SUFFIX,
     NEGATIVE_PRESETS,
+    PRESET_NAMES,
     PRESETS,
 )
 from ..core.file_utils import (
-    PromptEntry,
     get_available_txt_files,
     get_prompt_file_path,
-    parse_prompt_file,
+    load_prompt_entries,
 )
 
 
@@ -86,7 +86,7 @@ class AutoPromptLoader:
                 ),
                 "mode": (["sequential", "random"], {"default": "sequential"}),
                 "preset": (
-                    list(PRESETS.keys()),
+                    PRESET_NAMES,
                     {"default": "standard"},
                 ),
                 "random_action": ("BOOLEAN", {"default": True}),
@@ -158,7 +158,7 @@ class AutoPromptLoader:
         file_path = get_prompt_file_path(prompt_file)
 
         try:
-            prompts: list[PromptEntry] = parse_prompt_file(file_path)
+            prompts = load_prompt_entries(file_path)
         except FileNotFoundError:
             return (f"Error: {prompt_file} not found", "", "", 0, 0)
         except OSError as e:
@@ -169,12 +169,11 @@ class AutoPromptLoader:
 
         total = len(prompts)
 
-        # Initialize random with seed for reproducibility
-        random.seed(seed)
+        rng = random.Random(seed)
 
         # Select prompt based on mode
         if mode == "random":
-            selected_index = random.randint(0, total - 1)
+            selected_index = rng.randint(0, total - 1)
         else:
             selected_index = index % total
 
@@ -202,34 +201,34 @@ class AutoPromptLoader:
 
         # 3. Random Action
         if random_action:
-            action = random.choice(ACTIONS)
+            action = rng.choice(ACTIONS)
             parts.append(action)
 
         # 4. Random Background
         if random_background:
-            background = random.choice(BACKGROUNDS)
+            background = rng.choice(BACKGROUNDS)
             parts.append(background)
 
         # 5. Random Camera Effects
         if random_camera:
-            camera = random.choice(CAMERA_EFFECTS)
+            camera = rng.choice(CAMERA_EFFECTS)
             parts.append(camera)
 
         # 6. Custom Positive
-        if custom_positive.strip():
-            custom = custom_positive.strip().lstrip(",").strip()
-            if custom:
-                parts.append(custom)
+        custom = custom_positive.strip().lstrip(",").strip()
+        if custom:
+            parts.append(custom)
 
         # Join all parts with comma separator
-        final_prompt = ", ".join(filter(None, parts))
+        final_prompt = ", ".join(parts)
 
         # Combine preset negative + custom_negative
-        if custom_negative.strip():
+        custom_neg = custom_negative.strip()
+        if custom_neg:
             if preset_negative:
-                final_negative = f"{preset_negative}, {custom_negative.strip()}"
+                final_negative = f"{preset_negative}, {custom_neg}"
             else:
-                final_negative = custom_negative.strip()
+                final_negative = custom_neg
         else:
             final_negative = preset_negative
 
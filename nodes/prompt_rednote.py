@@ -5,17 +5,9 @@ AnimePromptRedNote node for ComfyUI - FLUX/QWEN COMPATIBLE.
 - Fixes 'Tag Soup' for Flux generations.
 """
 
-import random
-import re
+import functools
 from typing import Any
 
-from ..core.random_utils import (
-    needs_safety_shorts,
-    pick_action,
-    pick_background,
-    pick_camera,
-)
-
 from ..core.constants import (
     ACTIONS,
     BACKGROUNDS,
@@ -24,23 +16,73 @@ from ..core.constants import (
     FLUX_PREFIX,
     FLUX_STYLE_PREFIX,
     NEGATIVE_PRESETS,
+    PRESET_NAMES,
     PRESETS,
     QUALITY_TAGS,
 )
 from ..core.file_utils import (
+    PromptEntry,
     get_available_txt_files,
     get_prompt_file_path,
-    parse_prompt_file,
+    load_clean_tags,
+    load_prompt_entries_with_tags,
 )
+from ..core.random_utils import needs_safety_shorts_idx
 from ..core.rednote_utils import (
     REDNOTE_CHARACTER,
     REDNOTE_NEG_BASE,
     REDNOTE_NEG_SAFETY,
     REDNOTE_SAFETY_SHORTS,
     REDNOTE_STYLE,
+    clean_tag,
     get_mood_prompt,
 )
 
+# Preset combo choices: the shared preset names plus the RedNote default
+_PRESET_CHOICES: list[str] = ["RedNote", *PRESET_NAMES]
+
+# RedNote style/character blocks without their leading separator
+_REDNOTE_STYLE_TAGS = REDNOTE_STYLE.lstrip(", ").strip()
+_REDNOTE_CHARACTER_TAGS = REDNOTE_CHARACTER.lstrip(", ").strip()
+
+# Node output: (prompts, negative, character_names, mood_tags)
+_RedNoteResult = tuple[list[str], str, list[str], list[str]]
+# Loaded inputs: (character entries, character clean tags, style clean tags)
+_LoadedFiles = tuple[tuple[PromptEntry, ...], tuple[str, ...], tuple[str, ...]]
+
+
+@functools.lru_cache(maxsize=64)
+def _build_negative(preset: str, custom_negative: str, is_flux: bool) -> str:
+    """
+    Build the batch negative prompt (cached: it only depends on the inputs).
+
+    Args:
+        preset: Selected preset name ("RedNote" or a PRESETS key).
+        custom_negative: User negative tags, already stripped.
+        is_flux: Whether the Flux/Qwen natural-language mode is active.
+
+    Returns:
+        Combined negative prompt.
+    """
+    if is_flux:
+        return ""  # Flux works best with empty negative
+
+    negative_parts = []
+    if preset == "RedNote":
+        negative_parts.append(REDNOTE_NEG_BASE)
+        negative_parts.append(REDNOTE_NEG_SAFETY)
+    else:
+        preset_neg = NEGATIVE_PRESETS.get(preset, "")
+        if preset_neg:
+            negative_parts.append(preset_neg)
+        else:
+            negative_parts.append(REDNOTE_NEG_BASE)
+
+    if custom_negative:
+        negative_parts.append(custom_negative)
+
+    return ", ".join(negative_parts)
+
 
 class AutoPromptRedNote:
     CATEGORY = "prompt/anime"
@@ -57,7 +99,6 @@ class AutoPromptRedNote:
             if "style_names_v1.txt" in txt_files
             else (txt_files[0] if txt_files else "")
         )
-        preset_list = ["RedNote"] + list(PRESETS.keys())
 
         return {
             "required": {
@@ -76,7 +117,7 @@ class AutoPromptRedNote:
                     {"default": 0, "min": 0, "max": 99999, "step": 1},
                 ),
                 "batch_size": ("INT", {"default": 1, "min": 1, "max": 1000, "step": 1}),
-                "preset": (preset_list, {"default": "RedNote"}),
+                "preset": (_PRESET_CHOICES, {"default": "RedNote"}),
                 "mode": (["sequential", "random"], {"default": "sequential"}),
                 "mood_level": (
                     "FLOAT",
@@ -108,32 +149,30 @@ class AutoPromptRedNote:
         Aggressive cleaner for Flux/Natural Language.
         Removes: weights (:1.3), parens, '1girl', 'lora triggers', and fixes commas.
         """
-        if not text:
-            return ""
-
-        # 1. Remove weights (e.g., :1.3, :0.5, :1)
-        text = re.sub(r":\d+(\.\d+)?", "", text)
+        return clean_tag(text)
 
-        # 2. Remove parenthesis completely
-        text = text.replace("(", "").replace(")", "").replace("{", "").replace("}", "")
-
-        # 3. Replace underscores with spaces
-        text = text.replace("_", " ")
-
-        # 4. Remove Booru-isms that sound robotic in sentences
-        # Remove '1girl' (we already say 'A girl with...')
-        text = re.sub(r"\b1girl\b", "", text, flags=re.IGNORECASE)
-        # Remove 'lora triggers:' junk text (Case insensitive)
-        text = re.sub(r"(?i)lora triggers?:?", "", text)
+    def _load_or_error(
+        self, prompt_file: str, style_file: str
+    ) -> tuple[_LoadedFiles | None, _RedNoteResult | None]:
+        """
+        Load and validate the character and style files.
 
-        # 5. Fix Comma Spacing (tag1,tag2 -> tag1, tag2)
-        text = re.sub(r",\s*", ", ", text)
+        Returns:
+            ((char_prompts, char_tags, style_tags), None) on success, or
+            (None, error_result) with the node output to return on failure.
+        """
+        try:
+            char_prompts, char_tags = load_prompt_entries_with_tags(
+                get_prompt_file_path(prompt_file)
+            )
+            style_tags = load_clean_tags(get_prompt_file_path(style_file))
+        except Exception:
+            return None, (["Error loading files"], "", ["Error"], ["Error"])
 
-        # 6. Cleanup double spaces or trailing punctuation
-        text = re.sub(r"\s+", " ", text).strip()
-        text = text.strip(", ")  # Remove trailing commas
+        if not char_prompts:
+            return None, (["Error: No prompts"], "", ["Error"], ["Error"])
 
-        return text
+        return (char_prompts, char_tags, style_tags), None
 
     def generate_rednote(
         self,
@@ -152,170 +191,172 @@ class AutoPromptRedNote:
         custom_positive: str = "",
         custom_negative: str = "",
         seed: int = 0,
-    ) -> tuple[list[str], str, list[str], list[str]]:
-        try:
-            char_prompts = parse_prompt_file(get_prompt_file_path(prompt_file))
-            style_prompts = parse_prompt_file(get_prompt_file_path(style_file))
-        except Exception:
-            return (["Error loading files"], "", ["Error"], ["Error"])
-
-        if not char_prompts:
-            return (["Error: No prompts"], "", ["Error"], ["Error"])
+    ) -> _RedNoteResult:
+        loaded, error = self._load_or_error(prompt_file, style_file)
+        if loaded is None:
+            return error
+        char_prompts, char_tags, style_tags = loaded
 
         # Setup
-        target_list = char_prompts
-        total_chars = len(target_list)
-        total_styles = len(style_prompts) if style_prompts else 0
+        total_chars = len(char_prompts)
+        total_styles = len(style_tags)
         prompts_out = []
-        character_names_out = []
-        mood_tags_out = []
 
         # Detect Model Mode
         is_flux = target_model == "Flux/Qwen (Natural)"
 
-        # Use time-based seed if seed is -1 (true random), otherwise use provided seed
-        if seed == -1:
-            rng = random.Random()  # Uses current time
-        else:
-            rng = random.Random(seed)
+        # Preset selection is fixed for the whole batch
+        is_rednote = preset == "RedNote"
+        preset_tags = "" if is_rednote else PRESETS.get(preset, "")
 
-        for i in range(batch_size):
-            current_index = start_index + i
+        # numpy is imported here (not at module level) so loading the node
+        # at ComfyUI startup doesn't pay for it
+        import numpy as np
 
-            # Select Character
-            if mode == "random":
-                char_idx = rng.randint(0, total_chars - 1)
-            else:
-                char_idx = current_index % total_chars
-            entry = target_list[char_idx]
+        # Use OS entropy if seed is -1 (true random), otherwise use provided seed
+        rng = np.random.default_rng(None if seed == -1 else seed)
+
+        def draw(n: int) -> list[int]:
+            """Draw batch_size indices in [0, n) with one vectorized call."""
+            return rng.integers(n, size=batch_size).tolist()
+
+        # Draw every random pick for the batch up front (one call per
+        # category); sequential/locked selections are plain index ranges
+        if mode == "random":
+            char_indices = draw(total_chars)
+        else:
+            char_indices = [(start_index + i) % total_chars for i in range(batch_size)]
+        no_picks = [""] * batch_size
+        if not total_styles:
+            style_picks = no_picks
+        elif enable_style_lock:
+            style_picks = [
+                style_tags[(start_index + i) % total_styles] for i in range(batch_size)
+            ]
+        else:
+            style_picks = [style_tags[j] for j in draw(total_styles)]
+        action_indices = draw(len(ACTIONS)) if random_action else []
+        backgrounds = (
+            [BACKGROUNDS[j] for j in draw(len(BACKGROUNDS))]
+            if random_background
+            else no_picks
+        )
+        cameras = (
+            [CAMERA_EFFECTS[j] for j in draw(len(CAMERA_EFFECTS))]
+            if random_camera
+            else no_picks
+        )
+
+        # Flux sentence pieces that don't change across the batch
+        action_connector = FLUX_CONNECTORS["action"]
+        background_connector = FLUX_CONNECTORS["background"]
+        # Mood depends only on mood_level, so it is the same for every item
+        mood_tags = get_mood_prompt(mood_level)
+        mood_part = (
+            f" {FLUX_CONNECTORS['mood']} {self.clean_tag(mood_tags)}."
+            if mood_tags
+            else ""
+        )
+        # Clean the custom prompt too!
+        custom_part = f" {self.clean_tag(custom_positive)}." if custom_positive else ""
 
+        for i in range(batch_size):
             # Select Style
-            style_tag = ""
-            if style_prompts:
-                if enable_style_lock:
-                    style_idx = current_index % total_styles
-                else:
-                    style_idx = rng.randint(0, total_styles - 1)
-                style_tag = style_prompts[style_idx].tags.strip().rstrip(",")
+            style_tag = style_picks[i]
 
             # --- BRANCHING LOGIC ---
 
             if is_flux:
                 # === FLUX / NATURAL LANGUAGE MODE ===
+                entry = char_prompts[char_indices[i]]
 
-                # 1. Subject Sentence
                 # Clean the character tags (remove :1.2, underscores)
                 clean_char_tags = self.clean_tag(entry.tags)
                 clean_char_name = self.clean_tag(entry.character_name)
 
-                # "A high-quality anime illustration of [Name], a girl with [Tags]."
-                prompt_text = (
-                    f"{FLUX_PREFIX} {clean_char_name}, a girl with {clean_char_tags}."
-                )
-
+                # Optional sentences: each is "" or " <sentence>." (4. Mood is
+                # precomputed above)
                 # 2. Action Sentence
-                if random_action:
-                    act = pick_action(rng)
-                    clean_act = self.clean_tag(act)
-                    prompt_text += f" {FLUX_CONNECTORS['action']} {clean_act}."
+                action_part = (
+                    f" {action_connector} {self.clean_tag(ACTIONS[action_indices[i]])}."
+                    if random_action
+                    else ""
+                )
 
                 # 3. Background Sentence
-                if random_background:
-                    bg = pick_background(rng)
-                    clean_bg = self.clean_tag(bg)
-                    prompt_text += f" {FLUX_CONNECTORS['background']} {clean_bg}."
-
-                # 4. Mood/Expression Sentence
-                mood_tags = get_mood_prompt(mood_level)
-                if mood_tags:
-                    clean_mood = self.clean_tag(mood_tags)
-                    prompt_text += f" {FLUX_CONNECTORS['mood']} {clean_mood}."
-
-                # 5. Style/Camera Sentence
-                if style_tag or random_camera:
-                    cam = pick_camera(rng) if random_camera else ""
-                    clean_style = self.clean_tag(style_tag)
-                    clean_cam = self.clean_tag(cam)
-
-                    if clean_style:
-                        prompt_text += f" {FLUX_STYLE_PREFIX} {clean_style}."
-                    if clean_cam:
-                        prompt_text += f" {clean_cam}."
+                bg_part = (
+                    f" {background_connector} {self.clean_tag(backgrounds[i])}."
+                    if random_background
+                    else ""
+                )
 
-                if custom_positive:
-                    # Clean the custom prompt too!
-                    clean_custom = self.clean_tag(custom_positive)
-                    prompt_text += f" {clean_custom}."
+                # 5. Style/Camera Sentence (cameras[i] is "" when disabled)
+                clean_style = self.clean_tag(style_tag)
+                clean_cam = self.clean_tag(cameras[i])
+                style_part = (
+                    f" {FLUX_STYLE_PREFIX} {clean_style}." if clean_style else ""
+                )
+                cam_part = f" {clean_cam}." if clean_cam else ""
 
-                prompts_out.append(prompt_text)
+                # 1. Subject Sentence, then the rest in order:
+                # "A high-quality anime illustration of [Name], a girl with [Tags]."
+                prompts_out.append(
+                    f"{FLUX_PREFIX} {clean_char_name}, a girl with {clean_char_tags}."
+                    f"{action_part}{bg_part}{mood_part}{style_part}{cam_part}"
+                    f"{custom_part}"
+                )
 
             else:
                 # === ILLUSTRIOUS / TAG MODE (Your original logic) ===
                 parts = []
 
                 # Layer 1: Quality
-                if preset == "RedNote":
+                if is_rednote:
                     parts.append(QUALITY_TAGS)
-                    parts.append(REDNOTE_STYLE.lstrip(", ").strip())
-                else:
-                    preset_tags = PRESETS.get(preset, "")
-                    if preset_tags:
-                        parts.append(preset_tags)
+                    parts.append(_REDNOTE_STYLE_TAGS)
+                elif preset_tags:
+                    parts.append(preset_tags)
 
                 # Layer 2: Artist Style
                 if style_tag:
                     parts.append(style_tag)
 
                 # Layer 3: Character
-                parts.append(entry.tags.strip().rstrip(","))
+                character_tags = char_tags[char_indices[i]]
+                if character_tags:
+                    parts.append(character_tags)
 
                 # Layer 4: Action & Safety
                 if random_action:
-                    selected_action = pick_action(rng)
-                    parts.append(selected_action)
-                    if needs_safety_shorts(selected_action):
+                    action_idx = action_indices[i]
+                    parts.append(ACTIONS[action_idx])
+                    if needs_safety_shorts_idx(action_idx):
                         parts.append(REDNOTE_SAFETY_SHORTS)
 
                 if random_background:
-                    parts.append(pick_background(rng))
+                    parts.append(backgrounds[i])
                 if random_camera:
-                    parts.append(pick_camera(rng))
+                    parts.append(cameras[i])
 
                 # Layer 5: Mood
-                mood_tags = get_mood_prompt(mood_level)
-                parts.append(mood_tags)
+                if mood_tags:
+                    parts.append(mood_tags)
 
                 # Layer 6: RedNote Enforcers
-                if preset == "RedNote":
-                    parts.append(REDNOTE_CHARACTER.lstrip(", ").strip())
+                if is_rednote:
+                    parts.append(_REDNOTE_CHARACTER_TAGS)
 
                 if custom_positive:
                     parts.append(custom_positive)
 
-                final_prompt = ", ".join(filter(None, parts))
+                final_prompt = ", ".join(parts)
                 prompts_out.append(final_prompt)
 
-            character_names_out.append(entry.character_name)
-            mood_tags_out.append(mood_tags)
-
         # 4. Construct Negative Prompt
-        if is_flux:
-            final_negative = ""  # Flux works best with empty negative
-        else:
-            negative_parts = []
-            if preset == "RedNote":
-                negative_parts.append(REDNOTE_NEG_BASE)
-                negative_parts.append(REDNOTE_NEG_SAFETY)
-            else:
-                preset_neg = NEGATIVE_PRESETS.get(preset, "")
-                if preset_neg:
-                    negative_parts.append(preset_neg)
-                else:
-                    negative_parts.append(REDNOTE_NEG_BASE)
-
-            if custom_negative.strip():
-                negative_parts.append(custom_negative.strip())
+        final_negative = _build_negative(preset, custom_negative.strip(), is_flux)
 
-            final_negative = ", ".join(filter(None, negative_parts))
+        # Names and mood are built in bulk from the precomputed picks
+        character_names_out = [char_prompts[j].character_name for j in char_indices]
+        mood_tags_out = [mood_tags] * batch_size
 
         return (prompts_out, final_negative, character_names_out, mood_tags_out)
@@ -7,10 +7,42 @@ Outputs both positive and negative prompt suffixes.
 
 from typing import Any
 
-from ..core.constants import DEFAULT_NEGATIVE, NEGATIVE_PRESETS, PRESETS
+from ..core.constants import (
+    DEFAULT_NEGATIVE,
+    NEGATIVE_PRESETS,
+    PRESET_NAMES,
+    PRESETS,
+)
 
 # Safe fallback preset key
 _DEFAULT_PRESET_KEY = "standard"
+_DEFAULT_SUFFIX = PRESETS.get(_DEFAULT_PRESET_KEY, "")
+
+# Static input spec, built once and returned as-is by INPUT_TYPES
+_INPUT_TYPES: dict[str, Any] = {
+    "required": {
+        "preset": (PRESET_NAMES, {"default": "standard"}),
+        "use_custom": ("BOOLEAN", {"default": False}),
+    },
+    "optional": {
+        "custom_suffix": (
+            "STRING",
+            {
+                "default": "",
+                "multiline": True,
+                "placeholder": "Custom positive suffix",
+            },
+        ),
+        "custom_negative": (
+            "STRING",
+            {
+                "default": "",
+                "multiline": True,
+                "placeholder": "Custom negative prompt",
+            },
+        ),
+    },
+}
 
 
 class SuffixEditor:
@@ -24,30 +56,7 @@ class SuffixEditor:
     @classmethod
     def INPUT_TYPES(cls) -> dict[str, Any]:
         """Define input parameters for the node."""
-        return {
-            "required": {
-                "preset": (list(PRESETS.keys()), {"default": "standard"}),
-                "use_custom": ("BOOLEAN", {"default": False}),
-            },
-            "optional": {
-                "custom_suffix": (
-                    "STRING",
-                    {
-                        "default": "",
-                        "multiline": True,
-                        "placeholder": "Custom positive suffix",
-                    },
-                ),
-                "custom_negative": (
-                    "STRING",
-                    {
-                        "default": "",
-                        "multiline": True,
-                        "placeholder": "Custom negative prompt",
-                    },
-                ),
-            },
-        }
+        return _INPUT_TYPES
 
     def get_suffix(
         self,
@@ -69,14 +78,12 @@ class SuffixEditor:
             Tuple containing (positive_suffix, negative_prompt).
         """
         if use_custom:
-            suffix = custom_suffix.strip() or PRESETS.get(
-                preset, PRESETS.get(_DEFAULT_PRESET_KEY, "")
-            )
+            suffix = custom_suffix.strip() or PRESETS.get(preset, _DEFAULT_SUFFIX)
             negative = custom_negative.strip() or DEFAULT_NEGATIVE
             return (suffix, negative)
 
         # Use preset values with safe fallback for legacy workflows
-        positive = PRESETS.get(preset, PRESETS.get(_DEFAULT_PRESET_KEY, ""))
+        positive = PRESETS.get(preset, _DEFAULT_SUFFIX)
         negative = NEGATIVE_PRESETS.get(preset, DEFAULT_NEGATIVE)
 
         return (positive, negative)
@@ -0,0 +1,30 @@
+"""Shared banlists and keyword matcher for the filter scripts."""
+
+import re
+
+# First pass: rednote_1girl_v1.txt -> v2.txt (filter_rednote.py)
+BANNED_REDNOTE = [
+    "blue hair",
+    "blue dress",
+    "mermaid",
+    "sharp teeth",
+    "blue jacket",
+    "princess",
+]
+
+# Second pass: v2.txt -> v3.txt (filter_v3.py)
+BANNED_V3 = ["blue hair", "blue skirt"]
+
+
+def build_banlist_pattern(keywords: list[str]) -> re.Pattern[bytes]:
+    """
+    Compile banned keywords into one alternation so each line is scanned once.
+
+    The pattern works on raw UTF-8 bytes; match it against ``line.lower()``
+    of a line read in binary mode. Longer keywords come first so overlapping
+    entries ("blue hair" vs "blue") are tried longest-first.
+    """
+    unique = sorted(
+        {kw.lower().encode("utf-8") for kw in keywords}, key=len, reverse=True
+    )
+    return re.compile(b"|".join(map(re.escape, unique)))
@@ -1,3 +1,5 @@
+import itertools
+import math
 import random
 
 # Configuration
@@ -5,13 +7,44 @@ SOURCE_FILE = "rednote_1girl_v1.txt"
 DAILY_BATCH_SIZE = 50
 
 
+def reservoir_sample(iterable, k, rng=random):
+    """
+    Pick k items uniformly from an iterable of unknown length (Algorithm L).
+
+    Only k items are held in memory; whole runs of items between
+    replacements are skipped without being stored. Returns every item
+    (shuffled) if there are fewer than k.
+    """
+    it = iter(iterable)
+    reservoir = list(itertools.islice(it, k))
+    if len(reservoir) == k:
+        # 1.0 - random() lies in (0, 1], so log() never sees zero
+        w = math.exp(math.log(1.0 - rng.random()) / k)
+        while True:
+            skip = math.floor(math.log(1.0 - rng.random()) / math.log(1.0 - w))
+            item = next(itertools.islice(it, skip, None), None)
+            if item is None:
+                break
+            reservoir[rng.randrange(k)] = item
+            w *= math.exp(math.log(1.0 - rng.random()) / k)
+
+    # Reservoir slots keep file order; shuffle like random.sample would
+    rng.shuffle(reservoir)
+    return reservoir
+
+
 def get_daily_batch():
     try:
+        # Select 50 random units for today's production, streaming the file
+        # so only the sampled lines are kept in memory
         with open(SOURCE_FILE, encoding="utf-8") as f:
-            lines = f.readlines()
+            batch = reservoir_sample(f, DAILY_BATCH_SIZE)
 
-        # Select 50 random units for today's production
-        batch = random.sample(lines, DAILY_BATCH_SIZE)
+        # random.sample used to reject short files; keep that behaviour
+        if len(batch) < DAILY_BATCH_SIZE:
+            raise ValueError(
+                f"{SOURCE_FILE} has only {len(batch)} lines, need {DAILY_BATCH_SIZE}"
+            )
 
         with open("today_production.txt", "w", encoding="utf-8") as f:
             f.writelines(batch)
@@ -0,0 +1,91 @@
+"""
+Run the filter_rednote.py -> filter_v3.py pipeline in a single pass.
+
+Reads rednote_1girl_v1.txt once and writes v3.txt directly, dropping any line
+that matches either script's banlist. With --emit-intermediate the lines that
+pass the first banlist are also teed to v2.txt, still from the same read.
+"""
+
+import argparse
+import contextlib
+
+from banlist import BANNED_REDNOTE, BANNED_V3, build_banlist_pattern
+
+input_file = "rednote_1girl_v1.txt"
+intermediate_file = "v2.txt"
+output_file = "v3.txt"
+
+FLUSH_EVERY = 8192
+IO_BUFFER_SIZE = 1 << 20
+
+
+def filter_fused(emit_intermediate: bool = False) -> None:
+    banned_first = build_banlist_pattern(BANNED_REDNOTE)
+    banned_second = build_banlist_pattern(BANNED_V3)
+    banned_all = build_banlist_pattern(BANNED_REDNOTE + BANNED_V3)
+
+    print(f"Filtering {input_file} to {output_file}...")
+
+    total_lines = 0
+    mid_lines = 0
+    kept_lines = 0
+
+    with contextlib.ExitStack() as stack:
+        f_in = stack.enter_context(open(input_file, "rb", buffering=IO_BUFFER_SIZE))
+        f_out = stack.enter_context(open(output_file, "wb", buffering=IO_BUFFER_SIZE))
+        f_mid = (
+            stack.enter_context(open(intermediate_file, "wb", buffering=IO_BUFFER_SIZE))
+            if emit_intermediate
+            else None
+        )
+
+        buf = []
+        mid_buf = []
+        for line in f_in:
+            total_lines += 1
+            line_lower = line.lower()
+            if f_mid is None:
+                # One scan against the merged banlist
+                if banned_all.search(line_lower) is not None:
+                    continue
+            else:
+                if banned_first.search(line_lower) is not None:
+                    continue
+                mid_buf.append(line)
+                mid_lines += 1
+                if len(mid_buf) >= FLUSH_EVERY:
+                    f_mid.writelines(mid_buf)
+                    mid_buf.clear()
+                if banned_second.search(line_lower) is not None:
+                    continue
+
+            buf.append(line)
+            kept_lines += 1
+            if len(buf) >= FLUSH_EVERY:
+                f_out.writelines(buf)
+                buf.clear()
+
+        f_out.writelines(buf)
+        if f_mid is not None:
+            f_mid.writelines(mid_buf)
+
+    if emit_intermediate:
+        print(f"Wrote {mid_lines} lines to {intermediate_file}.")
+    print(f"Done. Processed {total_lines} lines, kept {kept_lines} lines.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--emit-intermediate",
+        action="store_true",
+        help=f"also write {intermediate_file} (lines passing the first banlist)",
+    )
+    args = parser.parse_args()
+
+    try:
+        filter_fused(args.emit_intermediate)
+    except FileNotFoundError:
+        print(f"Error: {input_file} not found.")
+    except Exception as e:
+        print(f"An error occurred: {e}")
@@ -1,7 +1,15 @@
+# Deprecated: filter_fused.py runs both filter passes in one read.
+
+from banlist import BANNED_V3, build_banlist_pattern
+
 input_file = "v2.txt"
 output_file = "v3.txt"
 
-banned_keywords = ["blue hair", "blue skirt"]
+banned = build_banlist_pattern(BANNED_V3)
+
+# Kept lines are flushed in batches rather than written one at a time
+FLUSH_EVERY = 8192
+IO_BUFFER_SIZE = 1 << 20
 
 print(f"Filtering {input_file} to {output_file}...")
 
@@ -10,19 +18,26 @@ total_lines = 0
 
 try:
     with (
-        open(input_file, encoding="utf-8") as f_in,
-        open(output_file, "w", encoding="utf-8") as f_out,
+        open(input_file, "rb", buffering=IO_BUFFER_SIZE) as f_in,
+        open(output_file, "wb", buffering=IO_BUFFER_SIZE) as f_out,
     ):
+        buf = []
         for line in f_in:
             total_lines += 1
+            # Lines stay as raw UTF-8 bytes: bytes.lower() only folds ASCII,
+            # which is all the (ASCII) keywords need, and skips decode/encode
             line_lower = line.lower()
-            if not any(keyword in line_lower for keyword in banned_keywords):
-                f_out.write(line)
+            if banned.search(line_lower) is None:
+                buf.append(line)
                 kept_lines += 1
+                if len(buf) >= FLUSH_EVERY:
+                    f_out.writelines(buf)
+                    buf.clear()
             else:
                 # Optional: print dropped lines for debugging
-                # print(f"Dropped: {line.strip()}")
+                # print(f"Dropped: {line.decode('utf-8').strip()}")
                 pass
+        f_out.writelines(buf)
 
     print(f"Done. Processed {total_lines} lines, kept {kept_lines} lines.")
 
@@ -4,11 +4,30 @@ This conftest handles the import path setup needed because the root package
 uses relative imports designed for ComfyUI's plugin loading system.
 """
 
+import os
+import random
 import sys
-from pathlib import Path
+
+import pytest
 
 # Add project root to path so 'core' module can be imported directly
 # without triggering the root __init__.py (which has ComfyUI-specific relative imports)
-project_root = Path(__file__).parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+
+# Mersenne Twister state for seed 42, computed once for the whole session
+_SEED_42_STATE = random.Random(42).getstate()
+
+
+@pytest.fixture
+def seeded_rng():
+    """Return a factory for fresh Random instances equivalent to Random(42)."""
+
+    def make() -> random.Random:
+        rng = random.Random()
+        rng.setstate(_SEED_42_STATE)
+        return rng
+
+    return make
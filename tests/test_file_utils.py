@@ -2,16 +2,29 @@
 
 import os
 
-# We need to set up the path before importing
-import sys
-import tempfile
-from pathlib import Path
-
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Imports handled by conftest.py
+import core.file_utils as file_utils
+from core.file_utils import (
+    PromptEntry,
+    apply_suffix,
+    get_available_txt_files,
+    get_prompt_file_path,
+    load_clean_tags,
+    load_prompt_entries,
+    load_prompt_entries_with_tags,
+    parse_prompt_file,
+    parse_prompt_file_cached,
+)
+
 
-from core.file_utils import PromptEntry, apply_suffix, parse_prompt_file
+@pytest.fixture
+def isolated_prompt_cache(tmp_path, monkeypatch):
+    """Point PROMPT_DIR at tmp_path and start with empty in-memory caches."""
+    monkeypatch.setattr(file_utils, "PROMPT_DIR", str(tmp_path))
+    monkeypatch.setattr(file_utils, "_PARSE_CACHE", {})
+    monkeypatch.setattr(file_utils, "_CLEAN_TAGS_CACHE", {})
 
 
 class TestApplySuffix:
@@ -37,6 +50,16 @@ class TestApplySuffix:
         result = apply_suffix("tag1, tag2", "")
         assert result == "tag1, tag2"
 
+    def test_whitespace_only_suffix(self):
+        """Test that a blank suffix leaves the tags unchanged."""
+        result = apply_suffix("tag1, tag2,", "   ")
+        assert result == "tag1, tag2"
+
+    def test_no_forced_comma(self):
+        """Test suffix is appended as-is when force_comma is False."""
+        result = apply_suffix("tag1", " suffix", force_comma=False)
+        assert result == "tag1suffix"
+
     def test_whitespace_handling(self):
         """Test whitespace is properly stripped."""
         result = apply_suffix("  tag1, tag2  ", "  , suffix  ")
@@ -46,60 +69,236 @@ class TestApplySuffix:
 class TestParsePromptFile:
     """Tests for the parse_prompt_file function."""
 
-    def test_parse_with_tab(self):
+    def test_parse_with_tab(self, tmp_path):
         """Test parsing lines with tab separator."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False, encoding="utf-8"
-        ) as f:
-            f.write("tag1, tag2\tCharacter Name\n")
-            f.write("tag3, tag4\tAnother Character\n")
-            temp_path = f.name
-
-        try:
-            prompts = parse_prompt_file(temp_path)
-            assert len(prompts) == 2
-            assert prompts[0] == PromptEntry(
-                tags="tag1, tag2", character_name="Character Name"
-            )
-            assert prompts[1] == PromptEntry(
-                tags="tag3, tag4", character_name="Another Character"
-            )
-        finally:
-            os.unlink(temp_path)
-
-    def test_parse_without_tab(self):
+        prompt_file = tmp_path / "prompts.txt"
+        prompt_file.write_text(
+            "tag1, tag2\tCharacter Name\ntag3, tag4\tAnother Character\n",
+            encoding="utf-8",
+        )
+
+        prompts = parse_prompt_file(str(prompt_file))
+        assert len(prompts) == 2
+        assert prompts[0] == PromptEntry(
+            tags="tag1, tag2", character_name="Character Name"
+        )
+        assert prompts[1] == PromptEntry(
+            tags="tag3, tag4", character_name="Another Character"
+        )
+
+    def test_parse_without_tab(self, tmp_path):
         """Test parsing lines without tab separator."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False, encoding="utf-8"
-        ) as f:
-            f.write("tag1, tag2, tag3\n")
-            temp_path = f.name
-
-        try:
-            prompts = parse_prompt_file(temp_path)
-            assert len(prompts) == 1
-            assert prompts[0] == PromptEntry(tags="tag1, tag2, tag3", character_name="")
-        finally:
-            os.unlink(temp_path)
-
-    def test_skip_empty_lines(self):
+        prompt_file = tmp_path / "prompts.txt"
+        prompt_file.write_text("tag1, tag2, tag3\n", encoding="utf-8")
+
+        prompts = parse_prompt_file(str(prompt_file))
+        assert len(prompts) == 1
+        assert prompts[0] == PromptEntry(tags="tag1, tag2, tag3", character_name="")
+
+    def test_skip_empty_lines(self, tmp_path):
         """Test that empty lines are skipped."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False, encoding="utf-8"
-        ) as f:
-            f.write("tag1\n")
-            f.write("\n")
-            f.write("   \n")
-            f.write("tag2\n")
-            temp_path = f.name
-
-        try:
-            prompts = parse_prompt_file(temp_path)
-            assert len(prompts) == 2
-        finally:
-            os.unlink(temp_path)
+        prompt_file = tmp_path / "prompts.txt"
+        prompt_file.write_text("tag1\n\n   \ntag2\n", encoding="utf-8")
+
+        prompts = parse_prompt_file(str(prompt_file))
+        assert len(prompts) == 2
+
+    def test_windows_line_endings(self, tmp_path):
+        """Test that CRLF line endings are handled."""
+        prompt_file = tmp_path / "prompts.txt"
+        prompt_file.write_bytes(b"tag1, tag2\tCharacter Name\r\ntag3\r\n")
+
+        prompts = parse_prompt_file(str(prompt_file))
+        assert prompts == [
+            PromptEntry(tags="tag1, tag2", character_name="Character Name"),
+            PromptEntry(tags="tag3", character_name=""),
+        ]
 
     def test_file_not_found(self):
         """Test FileNotFoundError is raised for missing files."""
         with pytest.raises(FileNotFoundError):
             parse_prompt_file("/nonexistent/file.txt")
+
+
+class TestGetAvailableTxtFiles:
+    """Tests for the get_available_txt_files function."""
+
+    def test_lists_only_txt_files(self, tmp_path, monkeypatch):
+        """Test that only .txt files are returned."""
+        (tmp_path / "a.txt").write_text("tag", encoding="utf-8")
+        (tmp_path / "b.csv").write_text("tag", encoding="utf-8")
+        monkeypatch.setattr(file_utils, "PROMPT_DIR", str(tmp_path))
+
+        assert get_available_txt_files() == ["a.txt"]
+
+    def test_rescans_when_directory_changes(self, tmp_path, monkeypatch):
+        """Test that a new file shows up once the directory mtime changes."""
+        (tmp_path / "a.txt").write_text("tag", encoding="utf-8")
+        monkeypatch.setattr(file_utils, "PROMPT_DIR", str(tmp_path))
+        assert get_available_txt_files() == ["a.txt"]
+
+        (tmp_path / "b.txt").write_text("tag", encoding="utf-8")
+        stat = os.stat(tmp_path)
+        os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert sorted(get_available_txt_files()) == ["a.txt", "b.txt"]
+
+    def test_missing_directory(self, tmp_path, monkeypatch):
+        """Test the placeholder is returned when the directory is missing."""
+        monkeypatch.setattr(file_utils, "PROMPT_DIR", str(tmp_path / "missing"))
+
+        assert get_available_txt_files() == ["No TXT files found"]
+
+
+@pytest.mark.usefixtures("isolated_prompt_cache")
+class TestParsePromptFileCached:
+    """Tests for the parse_prompt_file_cached function."""
+
+    def test_writes_and_reuses_cache(self, tmp_path, monkeypatch):
+        """Test that a second parse is served from the pickle cache."""
+        prompt_file = tmp_path / "chars.txt"
+        prompt_file.write_text("tag1, tag2\tCharacter Name\n", encoding="utf-8")
+
+        first = parse_prompt_file_cached(str(prompt_file))
+        assert list((tmp_path / ".cache").glob("*.pkl"))
+
+        monkeypatch.setattr(file_utils, "parse_prompt_file", None)
+        second = parse_prompt_file_cached(str(prompt_file))
+
+        assert first == second == [PromptEntry("tag1, tag2", "Character Name")]
+        assert isinstance(second[0], PromptEntry)
+
+    def test_invalidates_on_change(self, tmp_path):
+        """Test that editing the file bypasses the stale cache."""
+        prompt_file = tmp_path / "chars.txt"
+        prompt_file.write_text("tag1\n", encoding="utf-8")
+        assert parse_prompt_file_cached(str(prompt_file)) == [PromptEntry("tag1", "")]
+
+        prompt_file.write_text("tag1\ntag2\n", encoding="utf-8")
+
+        assert len(parse_prompt_file_cached(str(prompt_file))) == 2
+
+    def test_ignores_corrupt_cache(self, tmp_path):
+        """Test a truncated pickle falls back to parsing and is rewritten."""
+        prompt_file = tmp_path / "chars.txt"
+        prompt_file.write_text("tag1\n", encoding="utf-8")
+        parse_prompt_file_cached(str(prompt_file))
+        (cache_file,) = (tmp_path / ".cache").glob("*.pkl")
+        cache_file.write_bytes(cache_file.read_bytes()[:10])
+
+        assert parse_prompt_file_cached(str(prompt_file)) == [PromptEntry("tag1", "")]
+        assert len(cache_file.read_bytes()) > 10
+        assert not list((tmp_path / ".cache").glob("*.tmp"))
+
+    def test_ignores_other_cache_format(self, tmp_path, monkeypatch):
+        """Test a cache written with another format version is not trusted."""
+        prompt_file = tmp_path / "chars.txt"
+        prompt_file.write_text("tag1\n", encoding="utf-8")
+        parse_prompt_file_cached(str(prompt_file))
+
+        monkeypatch.setattr(file_utils, "_CACHE_FORMAT", file_utils._CACHE_FORMAT + 1)
+        calls = []
+        parse = file_utils.parse_prompt_file
+        monkeypatch.setattr(
+            file_utils,
+            "parse_prompt_file",
+            lambda path: calls.append(path) or parse(path),
+        )
+
+        assert parse_prompt_file_cached(str(prompt_file)) == [PromptEntry("tag1", "")]
+        assert calls == [str(prompt_file)]
+
+    def test_file_not_found(self):
+        """Test FileNotFoundError is raised for missing files."""
+        with pytest.raises(FileNotFoundError):
+            parse_prompt_file_cached("/nonexistent/file.txt")
+
+
+@pytest.mark.usefixtures("isolated_prompt_cache")
+class TestLoadPromptEntries:
+    """Tests for the load_prompt_entries function."""
+
+    def test_reuses_memory_cache(self, tmp_path, monkeypatch):
+        """Test that a second load skips parsing and returns the same tuple."""
+        prompt_file = tmp_path / "chars.txt"
+        prompt_file.write_text("tag1\tName\n", encoding="utf-8")
+
+        first = load_prompt_entries(str(prompt_file))
+        monkeypatch.setattr(file_utils, "parse_prompt_file_cached", None)
+        second = load_prompt_entries(str(prompt_file))
+
+        assert first is second
+        assert first == (PromptEntry("tag1", "Name"),)
+
+    def test_invalidates_on_change(self, tmp_path):
+        """Test that editing the file reloads its entries."""
+        prompt_file = tmp_path / "chars.txt"
+        prompt_file.write_text("tag1\n", encoding="utf-8")
+        assert len(load_prompt_entries(str(prompt_file))) == 1
+
+        prompt_file.write_text("tag1\ntag2\n", encoding="utf-8")
+
+        assert len(load_prompt_entries(str(prompt_file))) == 2
+
+    def test_evicts_oldest_file_when_full(self, tmp_path, monkeypatch):
+        """Test that the cache is capped and drops the oldest file first."""
+        monkeypatch.setattr(file_utils, "_MEMORY_CACHE_MAX_FILES", 2)
+        paths = []
+        for name in ("a", "b", "c"):
+            prompt_file = tmp_path / f"{name}.txt"
+            prompt_file.write_text(f"{name}\n", encoding="utf-8")
+            paths.append(str(prompt_file))
+            load_prompt_entries(paths[-1])
+
+        assert list(file_utils._PARSE_CACHE) == paths[1:]
+
+
+@pytest.mark.usefixtures("isolated_prompt_cache")
+class TestLoadCleanTags:
+    """Tests for the load_clean_tags function."""
+
+    def test_strips_trailing_commas(self, tmp_path):
+        """Test tags are returned cleaned and parallel to the entries."""
+        prompt_file = tmp_path / "chars.txt"
+        prompt_file.write_text("tag1, tag2,\tName\ntag3\n", encoding="utf-8")
+
+        assert load_clean_tags(str(prompt_file)) == ("tag1, tag2", "tag3")
+
+    def test_reuses_until_file_changes(self, tmp_path):
+        """Test the column is reused, then rebuilt after an edit."""
+        prompt_file = tmp_path / "chars.txt"
+        prompt_file.write_text("tag1,\n", encoding="utf-8")
+        first = load_clean_tags(str(prompt_file))
+        assert load_clean_tags(str(prompt_file)) is first
+
+        prompt_file.write_text("tag1,\ntag2,\n", encoding="utf-8")
+
+        assert load_clean_tags(str(prompt_file)) == ("tag1", "tag2")
+
+    def test_with_entries_returns_parallel_columns(self, tmp_path):
+        """Test entries and tags come from the same parsed version."""
+        prompt_file = tmp_path / "chars.txt"
+        prompt_file.write_text("tag1,\tA\n", encoding="utf-8")
+        entries, tags = load_prompt_entries_with_tags(str(prompt_file))
+        assert entries is load_prompt_entries(str(prompt_file))
+        assert tags == ("tag1",)
+
+        prompt_file.write_text("tag1,\tA\ntag2,\tB\n", encoding="utf-8")
+        entries, tags = load_prompt_entries_with_tags(str(prompt_file))
+
+        assert [e.character_name for e in entries] == ["A", "B"]
+        assert tags == ("tag1", "tag2")
+
+
+class TestGetPromptFilePath:
+    """Tests for the get_prompt_file_path function."""
+
+    def test_joins_with_prompt_dir(self):
+        """Test the result matches os.path.join on the prompt directory."""
+        expected = os.path.join(file_utils.PROMPT_DIR, "sample.txt")
+        assert get_prompt_file_path("sample.txt") == expected
+
+    def test_absolute_name_is_kept(self, tmp_path):
+        """Test an absolute file name is returned unchanged, as with join."""
+        absolute = str(tmp_path / "elsewhere.txt")
+        assert get_prompt_file_path(absolute) == absolute
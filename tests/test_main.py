@@ -0,0 +1,39 @@
+"""Unit tests for the main.py CSV-to-prompts script."""
+
+import sys
+
+import pytest
+
+# main.py needs pandas, which the node pack itself doesn't depend on
+pytest.importorskip("pandas")
+
+import main  # noqa: E402
+
+# Quoted empty cell and a literal NA, mixed with ordinary tag rows
+_CSV = '"a, b,",x\n"",y\nNA,z\nc,w\n'
+
+
+def _run(tmp_path, monkeypatch) -> str:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / main.INPUT_FILE).write_text(_CSV, encoding="utf-8")
+    # Small chunks so the stream spans several writes
+    monkeypatch.setattr(main, "CHUNK_SIZE", 2)
+    main.generate_prompts()
+    return (tmp_path / main.OUTPUT_FILE).read_text(encoding="utf-8")
+
+
+class TestGeneratePrompts:
+    """Tests for generate_prompts with and without pyarrow."""
+
+    expected = "".join(tags + main.LINE_END for tags in ("a, b", "", "NA", "c"))
+
+    def test_pandas_fallback_keeps_empty_and_na_cells(self, tmp_path, monkeypatch):
+        """Test the pandas parser writes empty/NA cells as literal strings."""
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        monkeypatch.setitem(sys.modules, "pyarrow.csv", None)
+        assert _run(tmp_path, monkeypatch) == self.expected
+
+    def test_pyarrow_keeps_empty_and_na_cells(self, tmp_path, monkeypatch):
+        """Test the pyarrow parser matches the pandas fallback."""
+        pytest.importorskip("pyarrow")
+        assert _run(tmp_path, monkeypatch) == self.expected
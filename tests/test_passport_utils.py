@@ -1,17 +1,25 @@
 """Unit tests for passport photo utilities.
 
-These tests are designed to work without torch/PIL/diffusers installed.
-They test constants and logic that doesn't require runtime dependencies.
+Most of these tests work without torch/PIL/diffusers installed and cover
+constants and logic that don't require runtime dependencies. Node tests are
+skipped when torch is missing.
 """
 
-import sys
-from pathlib import Path
+import importlib.util
+import os
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+
+def _load_passport_module():
+    """Load nodes/passport_photo.py without the relative imports in nodes/."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    path = os.path.join(root, "nodes", "passport_photo.py")
+    spec = importlib.util.spec_from_file_location("passport_photo", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
 
 
 class TestPassportConstants:
@@ -56,43 +64,43 @@ class TestPassportConstants:
 class TestValidationLogic:
     """Tests for validation logic (mathematical, no PIL required)."""
 
-    def test_square_detection_logic(self):
+    @pytest.mark.parametrize(
+        "width, height, expected_square",
+        [
+            (600, 600, True),
+            (300, 300, True),
+            (600, 400, False),
+            (400, 600, False),
+        ],
+    )
+    def test_square_detection_logic(self, width, height, expected_square):
         """Test that square detection works correctly."""
         # Test the mathematical logic without PIL
-        test_cases = [
-            ((600, 600), True),
-            ((300, 300), True),
-            ((600, 400), False),
-            ((400, 600), False),
-        ]
-
-        for (width, height), expected_square in test_cases:
-            is_square = width == height
-            assert is_square == expected_square
-
-    def test_minimum_size_logic(self):
+        assert (width == height) == expected_square
+
+    @pytest.mark.parametrize(
+        "width, height, expected_meets_min",
+        [
+            (600, 600, True),  # Meets 300px min
+            (300, 300, True),  # Exactly at min
+            (200, 200, False),  # Below min
+        ],
+    )
+    def test_minimum_size_logic(self, width, height, expected_meets_min):
         """Test minimum size detection logic."""
-        test_cases = [
-            ((600, 600), True),  # Meets 300px min
-            ((300, 300), True),  # Exactly at min
-            ((200, 200), False),  # Below min
-        ]
-
-        for (width, height), expected_meets_min in test_cases:
-            meets_min = min(width, height) >= 300
-            assert meets_min == expected_meets_min
-
-    def test_print_size_logic(self):
+        assert (min(width, height) >= 300) == expected_meets_min
+
+    @pytest.mark.parametrize(
+        "width, height, expected_meets_print",
+        [
+            (600, 600, True),  # CVS quality
+            (800, 800, True),  # Above CVS
+            (300, 300, False),  # Digital only
+        ],
+    )
+    def test_print_size_logic(self, width, height, expected_meets_print):
         """Test print quality size detection logic."""
-        test_cases = [
-            ((600, 600), True),  # CVS quality
-            ((800, 800), True),  # Above CVS
-            ((300, 300), False),  # Digital only
-        ]
-
-        for (width, height), expected_meets_print in test_cases:
-            meets_print = min(width, height) >= 600
-            assert meets_print == expected_meets_print
+        assert (min(width, height) >= 600) == expected_meets_print
 
 
 class TestDimensionsFormatting:
@@ -104,53 +112,73 @@ class TestDimensionsFormatting:
         dimensions = f"{width}x{height}"
         assert dimensions == "800x800"
 
-    def test_various_dimensions(self):
-        """Test various dimension formats."""
-        cases = [
+    @pytest.mark.parametrize(
+        "width, height, expected",
+        [
             (600, 600, "600x600"),
             (300, 300, "300x300"),
             (1024, 768, "1024x768"),
-        ]
-
-        for width, height, expected in cases:
-            assert f"{width}x{height}" == expected
+        ],
+    )
+    def test_various_dimensions(self, width, height, expected):
+        """Test various dimension formats."""
+        assert f"{width}x{height}" == expected
 
 
 class TestRecommendationLogic:
     """Test the recommendation logic paths."""
 
-    def test_recommendation_for_perfect_image(self):
-        """Test recommendation when image is perfect for print."""
-        width, height = 600, 600
-        is_square = width == height
-        meets_print = min(width, height) >= 600
-
-        # Should recommend CVS printing
-        assert is_square and meets_print
-
-    def test_recommendation_for_digital_only(self):
-        """Test recommendation when image is digital quality."""
-        width, height = 300, 300
-        is_square = width == height
-        meets_min = min(width, height) >= 300
-        meets_print = min(width, height) >= 600
-
-        # Square and meets min but not print
-        assert is_square and meets_min and not meets_print
-
-    def test_recommendation_for_too_small(self):
-        """Test recommendation when image is too small."""
-        width, height = 200, 200
-        is_square = width == height
-        meets_min = min(width, height) >= 300
-
-        # Square but doesn't meet min
-        assert is_square and not meets_min
-
-    def test_recommendation_for_non_square(self):
-        """Test recommendation for non-square image."""
-        width, height = 600, 400
-        is_square = width == height
-
-        # Not square
-        assert not is_square
+    @pytest.mark.parametrize(
+        "width, height, is_square, meets_min, meets_print",
+        [
+            pytest.param(600, 600, True, True, True, id="perfect_for_print"),
+            pytest.param(300, 300, True, True, False, id="digital_only"),
+            pytest.param(200, 200, True, False, False, id="too_small"),
+            pytest.param(600, 400, False, True, False, id="non_square"),
+        ],
+    )
+    def test_recommendation_inputs(
+        self, width, height, is_square, meets_min, meets_print
+    ):
+        """Test the checks each recommendation path is chosen from."""
+        assert (width == height) == is_square
+        assert (min(width, height) >= 300) == meets_min
+        assert (min(width, height) >= 600) == meets_print
+
+
+class TestPassportResize:
+    """Tests for the PassportResize node (requires torch)."""
+
+    def test_target_size_input_is_clamped_copy(self):
+        """Test the no-resize fast path clamps to [0, 1] and copies."""
+        torch = pytest.importorskip("torch")
+        passport = _load_passport_module()
+
+        image = torch.linspace(-0.05, 1.05, 600 * 600 * 3).reshape(1, 600, 600, 3)
+        result, _ = passport.PassportResize().resize_to_passport(
+            image, "2x2_inch_600dpi", "center"
+        )
+
+        assert result.shape == (1, 600, 600, 3)
+        assert result.min().item() == 0.0
+        assert result.max().item() == 1.0
+        assert result.data_ptr() != image.data_ptr()
+
+
+class TestPassportTile:
+    """Tests for the PassportTile node (requires torch)."""
+
+    @pytest.mark.parametrize("device", ["cpu", "cuda"])
+    def test_out_of_range_tile_is_clamped(self, device):
+        """Test both device paths clamp a 600x600 input to [0, 1]."""
+        torch = pytest.importorskip("torch")
+        if device == "cuda" and not torch.cuda.is_available():
+            pytest.skip("CUDA not available")
+        passport = _load_passport_module()
+
+        image = torch.linspace(-0.05, 1.05, 600 * 600 * 3, device=device)
+        (sheet,) = passport.PassportTile().tile_passport(image.reshape(1, 600, 600, 3))
+
+        assert sheet.shape == (1, 1200, 1800, 3)
+        assert sheet.min().item() == 0.0
+        assert sheet.max().item() == 1.0
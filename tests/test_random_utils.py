@@ -1,7 +1,5 @@
 """Unit tests for random selection utilities."""
 
-import random
-
 import pytest
 
 # Imports handled by conftest.py
@@ -11,6 +9,7 @@ from core.constants import ACTIONS, BACKGROUNDS, CAMERA_EFFECTS
 from core.random_utils import (
     SAFETY_TRIGGER_KEYWORDS,
     needs_safety_shorts,
+    needs_safety_shorts_idx,
     pick_action,
     pick_background,
     pick_camera,
@@ -21,17 +20,17 @@ from core.random_utils import (
 class TestPickRandom:
     """Tests for the pick_random function."""
 
-    def test_returns_item_from_list(self):
+    def test_returns_item_from_list(self, seeded_rng):
         """Test that returned item is from the provided list."""
         items = ["a", "b", "c"]
-        result = pick_random(items, random.Random(42))
+        result = pick_random(items, seeded_rng())
         assert result in items
 
-    def test_deterministic_with_seed(self):
+    def test_deterministic_with_seed(self, seeded_rng):
         """Test that same seed produces same result."""
         items = ["a", "b", "c"]
-        result1 = pick_random(items, random.Random(42))
-        result2 = pick_random(items, random.Random(42))
+        result1 = pick_random(items, seeded_rng())
+        result2 = pick_random(items, seeded_rng())
         assert result1 == result2
 
     def test_works_without_rng(self):
@@ -44,25 +43,25 @@ class TestPickRandom:
 class TestPickActionBackgroundCamera:
     """Tests for specialized pick functions."""
 
-    def test_pick_action_returns_action_from_list(self):
+    def test_pick_action_returns_action_from_list(self, seeded_rng):
         """Test pick_action returns a valid action."""
-        result = pick_action(random.Random(42))
+        result = pick_action(seeded_rng())
         assert result in ACTIONS
 
-    def test_pick_background_returns_background_from_list(self):
+    def test_pick_background_returns_background_from_list(self, seeded_rng):
         """Test pick_background returns a valid background."""
-        result = pick_background(random.Random(42))
+        result = pick_background(seeded_rng())
         assert result in BACKGROUNDS
 
-    def test_pick_camera_returns_camera_from_list(self):
+    def test_pick_camera_returns_camera_from_list(self, seeded_rng):
         """Test pick_camera returns a valid camera effect."""
-        result = pick_camera(random.Random(42))
+        result = pick_camera(seeded_rng())
         assert result in CAMERA_EFFECTS
 
-    def test_deterministic_across_functions(self):
+    def test_deterministic_across_functions(self, seeded_rng):
         """Test that seeded picks are deterministic across calls."""
-        rng1 = random.Random(42)
-        rng2 = random.Random(42)
+        rng1 = seeded_rng()
+        rng2 = seeded_rng()
 
         action1 = pick_action(rng1)
         bg1 = pick_background(rng1)
@@ -106,6 +105,11 @@ class TestNeedsSafetyShorts:
         """Test that function returns False for safe actions."""
         assert needs_safety_shorts(action) is False
 
+    def test_index_lookup_matches_keyword_scan(self):
+        """Test that the precomputed mask agrees with the string check."""
+        for idx, action in enumerate(ACTIONS):
+            assert needs_safety_shorts_idx(idx) is needs_safety_shorts(action)
+
     def test_safety_keywords_constant(self):
         """Test that safety keywords constant has expected values."""
         assert "sitting" in SAFETY_TRIGGER_KEYWORDS
@@ -0,0 +1,71 @@
+"""Unit tests for RedNote utilities."""
+
+import pytest
+
+from core.rednote_utils import (
+    REDNOTE_NEGATIVE_SUFFIX,
+    REDNOTE_POSITIVE_SUFFIX,
+    apply_rednote_style,
+    clean_tag,
+    get_mood_prompt,
+)
+
+
+class TestGetMoodPrompt:
+    """Tests for the get_mood_prompt function."""
+
+    @pytest.mark.parametrize(
+        "level, expected_tag",
+        [
+            (0.0, "slight smile"),
+            (0.19, "slight smile"),
+            (0.2, "expressionless"),
+            (0.39, "expressionless"),
+            (0.4, "stoned face"),
+            (0.6, "annoyed expression"),
+            (0.79, "annoyed expression"),
+            (0.8, "stubborn"),
+            (1.0, "stubborn"),
+        ],
+    )
+    def test_mood_bands(self, level: float, expected_tag: str):
+        """Test each level maps to the expected mood band."""
+        assert expected_tag in get_mood_prompt(level)
+
+
+class TestApplyRednoteStyle:
+    """Tests for the apply_rednote_style function."""
+
+    def test_appends_suffixes(self):
+        """Test positive and negative suffixes are appended."""
+        positive, negative = apply_rednote_style("1girl", "bad hands")
+        assert positive == "1girl" + REDNOTE_POSITIVE_SUFFIX
+        assert negative == "bad hands, " + REDNOTE_NEGATIVE_SUFFIX
+
+
+class TestCleanTag:
+    """Tests for the clean_tag function."""
+
+    def test_strips_weights_brackets_and_underscores(self):
+        """Test booru syntax becomes plain comma-separated text."""
+        assert clean_tag("(long_hair:1.2),{smile}") == "long hair, smile"
+
+    def test_removes_1girl_and_lora_triggers(self):
+        """Test robotic tags are dropped."""
+        assert clean_tag("Lora Triggers: 1girl, red eyes") == "red eyes"
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("", ""),
+            ("(){}", ""),
+            ("((({{}})))", ""),
+            ("___", ""),
+            ("(a_b)", "a b"),
+            ("{1girl}", ""),
+            ("(tag):(1.2)", "tag:1.2"),
+        ],
+    )
+    def test_tricky_inputs(self, text: str, expected: str):
+        """Test empty, bracket-only and underscore-only inputs."""
+        assert clean_tag(text) == expected